@@ -219,6 +219,11 @@ def startmodule(
         "--public/--no-public",
         help="Include public routes (no auth required)"
     ),
+    single_file_routes: bool = typer.Option(
+        False,
+        "--single-file-routes",
+        help="Generate one routes.py instead of the routes/ package"
+    ),
     force: bool = typer.Option(
         False,
         "--force",
@@ -247,12 +252,15 @@ def startmodule(
       $ python fcube.py startmodule inventory --dir app
 
       $ python fcube.py startmodule order --no-admin --force
+
+      $ python fcube.py startmodule invoice --single-file-routes
     """
     startmodule_command(
         module_name=module_name,
         directory=directory,
         with_admin=with_admin,
         with_public=with_public,
+        single_file_routes=single_file_routes,
         force=force
     )
 
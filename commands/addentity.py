@@ -14,7 +14,7 @@ from ..utils.helpers import (
     to_snake_case,
     to_pascal_case,
     ensure_directory,
-    write_file,
+    write_files,
 )
 from ..templates import (
     generate_model,
@@ -85,9 +85,10 @@ def addentity_command(
 
     console.print(f"[cyan]📝 Generating files...[/cyan]\n")
 
-    for file_path, content in files_to_create:
+    written = write_files(files_to_create, overwrite=force)
+    for (file_path, _), was_written in zip(files_to_create, written):
         relative_path = file_path.relative_to(module_dir)
-        if write_file(file_path, content, overwrite=force):
+        if was_written:
             created_files.append(str(relative_path))
             console.print(f"  [green]✓[/green] Created: {relative_path}")
         else:
@@ -30,8 +30,7 @@ from rich.tree import Tree
 from typing import List, Tuple
 
 from ..utils.helpers import (
-    ensure_directory,
-    write_file,
+    write_files,
 )
 from ..templates.plugins import (
     get_available_plugins,
@@ -225,17 +224,14 @@ def addplugin_command(
         return
     
     # Actual installation (non-dry-run)
-    # Ensure directories exist
-    for file_path, _ in files_to_create:
-        ensure_directory(file_path.parent)
-    
     # Create files
     console.print(f"[cyan]📝 Generating files...[/cyan]\n")
     
     created_files = []
-    for file_path, content in files_to_create:
+    written = write_files(files_to_create, overwrite=force)
+    for (file_path, _), was_written in zip(files_to_create, written):
         relative_path = file_path.relative_to(base_dir)
-        if write_file(file_path, content, overwrite=force):
+        if was_written:
             created_files.append(str(relative_path))
             console.print(f"  [green]✓[/green] Created: {relative_path}")
     
@@ -35,6 +35,7 @@ from typing import List, Tuple
 from ..utils.helpers import (
     ensure_directory,
     write_file,
+    write_files,
 )
 from ..templates.project.user import (
     AuthType,
@@ -104,7 +105,7 @@ def adduser_command(
         (user_dir / "__init__.py", generate_user_init()),
         (user_dir / "models.py", generate_user_models(auth_type)),
         (user_dir / "schemas.py", generate_user_schemas(auth_type)),
-        (user_dir / "crud.py", generate_user_crud()),
+        (user_dir / "crud.py", generate_user_crud(auth_type)),
         (user_dir / "exceptions.py", generate_user_exceptions()),
         (user_dir / "routes.py", generate_user_routes()),
         # Auth management
@@ -122,9 +123,10 @@ def adduser_command(
     console.print(f"[cyan]📝 Generating files...[/cyan]\n")
     
     created_files = []
-    for file_path, content in files_to_create:
+    written = write_files(files_to_create, overwrite=force)
+    for (file_path, _), was_written in zip(files_to_create, written):
         relative_path = file_path.relative_to(base_dir)
-        if write_file(file_path, content, overwrite=force):
+        if was_written:
             created_files.append(str(relative_path))
             console.print(f"  [green]✓[/green] Created: {relative_path}")
     
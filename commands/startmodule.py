@@ -48,7 +48,7 @@ from ..utils.helpers import (
     to_pascal_case,
     to_kebab_case,
     ensure_directory,
-    write_file,
+    write_files,
 )
 from ..templates import (
     generate_model,
@@ -64,6 +64,7 @@ from ..templates import (
     generate_public_routes_init,
     generate_admin_routes,
     generate_admin_routes_init,
+    generate_routes_single_file,
     generate_dependencies,
     generate_permissions,
     generate_exceptions,
@@ -82,6 +83,7 @@ def startmodule_command(
     directory: str = "app",
     with_admin: bool = True,
     with_public: bool = True,
+    single_file_routes: bool = False,
     force: bool = False,
 ):
     """
@@ -120,15 +122,16 @@ def startmodule_command(
         module_dir / "schemas",
         module_dir / "crud",
         module_dir / "services",
-        module_dir / "routes",
         module_dir / "utils",
         module_dir / "integrations",
     ]
     
-    if with_public:
-        directories_to_create.append(module_dir / "routes" / "public")
-    if with_admin:
-        directories_to_create.append(module_dir / "routes" / "admin")
+    if not single_file_routes:
+        directories_to_create.append(module_dir / "routes")
+        if with_public:
+            directories_to_create.append(module_dir / "routes" / "public")
+        if with_admin:
+            directories_to_create.append(module_dir / "routes" / "admin")
     
     for dir_path in directories_to_create:
         ensure_directory(dir_path)
@@ -170,18 +173,23 @@ def startmodule_command(
         (module_dir / "services" / f"{module_snake}_service.py", generate_service(module_snake, class_name)),
     ])
     
-    # Routes folder
-    files_to_create.append(
-        (module_dir / "routes" / "__init__.py", generate_routes_init(module_snake, class_name, with_public, with_admin))
-    )
+    # Routes: one routes.py, or the routes/ package
+    if single_file_routes:
+        files_to_create.append(
+            (module_dir / "routes.py", generate_routes_single_file(module_snake, class_name, with_public, with_admin))
+        )
+    else:
+        files_to_create.append(
+            (module_dir / "routes" / "__init__.py", generate_routes_init(module_snake, class_name, with_public, with_admin))
+        )
     
-    if with_public:
+    if with_public and not single_file_routes:
         files_to_create.extend([
             (module_dir / "routes" / "public" / "__init__.py", generate_public_routes_init(module_snake, class_name)),
             (module_dir / "routes" / "public" / f"{module_snake}.py", generate_public_routes(module_snake, class_name)),
         ])
     
-    if with_admin:
+    if with_admin and not single_file_routes:
         files_to_create.extend([
             (module_dir / "routes" / "admin" / "__init__.py", generate_admin_routes_init(module_snake, class_name)),
             (module_dir / "routes" / "admin" / f"{module_snake}_management.py", generate_admin_routes(module_snake, class_name)),
@@ -204,9 +212,10 @@ def startmodule_command(
     # Create files
     console.print(f"[cyan]📝 Generating files...[/cyan]\n")
 
-    for file_path, content in files_to_create:
+    written = write_files(files_to_create, overwrite=force)
+    for (file_path, _), was_written in zip(files_to_create, written):
         relative_path = file_path.relative_to(module_dir)
-        if write_file(file_path, content, overwrite=force):
+        if was_written:
             created_files.append(str(relative_path))
             console.print(f"  [green]✓[/green] Created: {relative_path}")
         else:
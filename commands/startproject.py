@@ -53,7 +53,7 @@ from ..utils.helpers import (
     to_snake_case,
     to_pascal_case,
     ensure_directory,
-    write_file,
+    write_files,
 )
 from ..templates.project import (
     # Core templates
@@ -269,9 +269,10 @@ def startproject_command(
     # Create files
     console.print(f"[cyan]📝 Generating files...[/cyan]\n")
 
-    for file_path, content in files_to_create:
+    written = write_files(files_to_create, overwrite=force)
+    for (file_path, _), was_written in zip(files_to_create, written):
         relative_path = file_path.relative_to(project_dir)
-        if write_file(file_path, content, overwrite=force):
+        if was_written:
             created_files.append(str(relative_path))
             console.print(f"  [green]✓[/green] Created: {relative_path}")
         else:
@@ -24,6 +24,7 @@ from .route_templates import (
     generate_public_routes_init,
     generate_admin_routes,
     generate_admin_routes_init,
+    generate_routes_single_file,
 )
 
 # Module-level templates
@@ -57,6 +58,7 @@ __all__ = [
     "generate_public_routes_init",
     "generate_admin_routes",
     "generate_admin_routes_init",
+    "generate_routes_single_file",
     # Module-level
     "generate_dependencies",
     "generate_permissions",
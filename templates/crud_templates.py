@@ -26,7 +26,7 @@ Pattern:
 - NEVER call session.commit() - let service layer handle it
 """
 
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List, Tuple
 from uuid import UUID
 
 from sqlalchemy import select, func
@@ -97,6 +97,76 @@ class {class_name}CRUD(CRUDBase[{class_name}, {class_name}Create, {class_name}Up
         result = await session.execute(query)
         return list(result.scalars().all())
     
+    async def list_with_total(
+        self,
+        session: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = True
+    ) -> Tuple[List[{class_name}], int]:
+        """
+        Get a page of {module_name}s together with the total match count.
+        
+        The total comes from a COUNT(*) OVER () window on the page query,
+        so listing and counting share one round trip.
+        
+        Args:
+            session: Database session
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            active_only: If True, list and count only active records
+            
+        Returns:
+            Tuple of ({class_name} instances, total count)
+        """
+        query = select(self.model, func.count().over().label("total"))
+        if active_only:
+            query = query.where(self.model.is_active == True).order_by(
+                self.model.created_at.desc()
+            )
+        else:
+            query = query.order_by(self.model.id)
+        result = await session.execute(query.offset(skip).limit(limit))
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        if not skip:
+            return [], 0
+        # Past the last page there is no row to carry the window total.
+        if active_only:
+            return [], await self.count_active(session)
+        return [], await self.count(session)
+    
+    async def stream(
+        self,
+        session: AsyncSession,
+        *,
+        active_only: bool = True,
+        yield_per: int = 100
+    ) -> AsyncIterator[{class_name}]:
+        """
+        Iterate over {module_name}s without loading them all at once.
+        
+        Rows are fetched from a server-side cursor in batches of yield_per.
+        
+        Args:
+            session: Database session
+            active_only: If True, yield only active records
+            yield_per: Number of rows fetched per batch
+            
+        Yields:
+            {class_name} instances
+        """
+        query = select(self.model).order_by(self.model.created_at.desc())
+        if active_only:
+            query = query.where(self.model.is_active == True)
+        result = await session.stream_scalars(
+            query.execution_options(yield_per=yield_per)
+        )
+        async for obj in result:
+            yield obj
+    
     async def get_with_relationships(
         self,
         session: AsyncSession,
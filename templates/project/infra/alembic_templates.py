@@ -7,10 +7,10 @@ Generates Alembic migration configuration:
 - migrations/script.py.mako
 """
 
+from typing import Final
 
-def generate_alembic_ini() -> str:
-    """Generate alembic.ini"""
-    return '''# Alembic Configuration
+
+_ALEMBIC_INI: Final[str] = '''# Alembic Configuration
 
 [alembic]
 script_location = %(here)s/migrations
@@ -54,9 +54,12 @@ datefmt = %H:%M:%S
 '''
 
 
-def generate_alembic_env() -> str:
-    """Generate migrations/env.py"""
-    return '''"""
+def generate_alembic_ini() -> str:
+    """Generate alembic.ini"""
+    return _ALEMBIC_INI
+
+
+_ALEMBIC_ENV: Final[str] = '''"""
 Alembic migration environment configuration.
 """
 
@@ -140,9 +143,12 @@ else:
 '''
 
 
-def generate_alembic_script_mako() -> str:
-    """Generate migrations/script.py.mako"""
-    return '''"""${message}
+def generate_alembic_env() -> str:
+    """Generate migrations/env.py"""
+    return _ALEMBIC_ENV
+
+
+_ALEMBIC_SCRIPT_MAKO: Final[str] = '''"""${message}
 
 Revision ID: ${up_revision}
 Revises: ${down_revision | comma,n}
@@ -169,3 +175,8 @@ def upgrade() -> None:
 def downgrade() -> None:
     ${downgrades if downgrades else "pass"}
 '''
+
+
+def generate_alembic_script_mako() -> str:
+    """Generate migrations/script.py.mako"""
+    return _ALEMBIC_SCRIPT_MAKO
@@ -7,69 +7,10 @@ Generates Docker-related configuration files:
 - Entrypoint scripts
 """
 
+from typing import Final
 
-def generate_docker_compose(project_name: str, with_celery: bool = True) -> str:
-    """Generate docker-compose.yml"""
-    celery_services = ""
-    if with_celery:
-        celery_services = f'''
-  # ==================== Celery Worker ====================
-  celery_worker:
-    build:
-      context: .
-      dockerfile: docker/Dockerfile
-    container_name: {project_name}_celery_worker
-    env_file:
-      - .env
-    environment:
-      POSTGRES_HOST: postgres
-      POSTGRES_PORT: 5432
-      REDIS_HOST: redis
-      REDIS_PORT: 6379
-    volumes:
-      - ./app:/app/app:ro
-      - ./logs:/app/logs
-    networks:
-      - {project_name}_network
-    depends_on:
-      postgres:
-        condition: service_healthy
-      redis:
-        condition: service_healthy
-    command: >
-      celery -A app.core.celery_app:celery_app worker
-      --loglevel=${{LOG_LEVEL:-info}}
-      --concurrency=4
-    restart: unless-stopped
-
-  # ==================== Flower Monitoring ====================
-  flower:
-    build:
-      context: .
-      dockerfile: docker/Dockerfile
-    container_name: {project_name}_flower
-    env_file:
-      - .env
-    environment:
-      REDIS_HOST: redis
-      REDIS_PORT: 6379
-    ports:
-      - "${{FLOWER_PORT:-5555}}:5555"
-    networks:
-      - {project_name}_network
-    depends_on:
-      redis:
-        condition: service_healthy
-    entrypoint: ["/app/docker/flower-entrypoint.sh"]
-    command: >
-      celery -A app.core.celery_app:celery_app flower
-      --port=5555
-      --broker=redis://redis:6379/0
-      --basic_auth=${{FLOWER_USERNAME:-admin}}:${{FLOWER_PASSWORD:-flower_password}}
-    restart: unless-stopped
-'''
 
-    return f'''services:
+_COMPOSE_HEAD: Final[str] = '''services:
   # ==================== PostgreSQL Database ====================
   postgres:
     image: postgres:16-alpine
@@ -85,6 +26,18 @@ def generate_docker_compose(project_name: str, with_celery: bool = True) -> str:
       - "${{POSTGRES_PORT:-5432}}:5432"
     volumes:
       - postgres_data:/var/lib/postgresql/data
+    # Defaults are PostgreSQL's own; .env.example relaxes durability and
+    # raises memory for local development only.
+    command: >
+      postgres
+      -c fsync=${{POSTGRES_FSYNC:-on}}
+      -c synchronous_commit=${{POSTGRES_SYNCHRONOUS_COMMIT:-on}}
+      -c full_page_writes=${{POSTGRES_FULL_PAGE_WRITES:-on}}
+      -c shared_buffers=${{POSTGRES_SHARED_BUFFERS:-128MB}}
+      -c work_mem=${{POSTGRES_WORK_MEM:-4MB}}
+    tmpfs:
+      - /tmp
+      - /var/run/postgresql
     networks:
       - {project_name}_network
     healthcheck:
@@ -152,7 +105,66 @@ def generate_docker_compose(project_name: str, with_celery: bool = True) -> str:
       retries: 3
       start_period: 40s
     restart: unless-stopped
-{celery_services}
+'''
+
+_COMPOSE_CELERY: Final[str] = '''
+  # ==================== Celery Worker ====================
+  celery_worker:
+    build:
+      context: .
+      dockerfile: docker/Dockerfile
+    container_name: {project_name}_celery_worker
+    env_file:
+      - .env
+    environment:
+      POSTGRES_HOST: postgres
+      POSTGRES_PORT: 5432
+      REDIS_HOST: redis
+      REDIS_PORT: 6379
+    volumes:
+      - ./app:/app/app:ro
+      - ./logs:/app/logs
+    networks:
+      - {project_name}_network
+    depends_on:
+      postgres:
+        condition: service_healthy
+      redis:
+        condition: service_healthy
+    command: >
+      celery -A app.core.celery_app:celery_app worker
+      --loglevel=${{LOG_LEVEL:-info}}
+      --concurrency=4
+    restart: unless-stopped
+
+  # ==================== Flower Monitoring ====================
+  flower:
+    build:
+      context: .
+      dockerfile: docker/Dockerfile
+    container_name: {project_name}_flower
+    env_file:
+      - .env
+    environment:
+      REDIS_HOST: redis
+      REDIS_PORT: 6379
+    ports:
+      - "${{FLOWER_PORT:-5555}}:5555"
+    networks:
+      - {project_name}_network
+    depends_on:
+      redis:
+        condition: service_healthy
+    entrypoint: ["/app/docker/flower-entrypoint.sh"]
+    command: >
+      celery -A app.core.celery_app:celery_app flower
+      --port=5555
+      --broker=redis://redis:6379/0
+      --basic_auth=${{FLOWER_USERNAME:-admin}}:${{FLOWER_PASSWORD:-flower_password}}
+    restart: unless-stopped
+'''
+
+_COMPOSE_TAIL: Final[str] = '''
 # ==================== Networks ====================
 networks:
   {project_name}_network:
@@ -168,9 +180,16 @@ volumes:
 '''
 
 
-def generate_dockerfile() -> str:
-    """Generate docker/Dockerfile"""
-    return '''# ==================== Multi-stage Dockerfile ====================
+def generate_docker_compose(project_name: str, with_celery: bool = True) -> str:
+    """Generate docker-compose.yml"""
+    parts = [_COMPOSE_HEAD]
+    if with_celery:
+        parts.append(_COMPOSE_CELERY)
+    parts.append(_COMPOSE_TAIL)
+    return "".join(parts).format(project_name=project_name)
+
+
+_DOCKERFILE: Final[str] = '''# ==================== Multi-stage Dockerfile ====================
 # Stage 1: Builder
 FROM python:3.13-slim AS builder
 
@@ -189,7 +208,12 @@ WORKDIR /app
 
 COPY pyproject.toml ./
 
-RUN uv pip install --system -r pyproject.toml
+RUN --mount=type=cache,target=/root/.cache/uv \\
+    UV_LINK_MODE=copy uv pip install --system -r pyproject.toml
+
+# Precompile dependencies in parallel; the runtime stage sets
+# PYTHONDONTWRITEBYTECODE and would otherwise recompile on every start.
+RUN python -m compileall -q -j 0 /usr/local/lib/python3.13/site-packages
 
 
 # ==================== Stage 2: Runtime ====================
@@ -233,9 +257,12 @@ CMD ["uvicorn", "app.core.main:app", "--host", "0.0.0.0", "--port", "8000"]
 '''
 
 
-def generate_docker_entrypoint() -> str:
-    """Generate docker/docker-entrypoint.sh"""
-    return '''#!/bin/bash
+def generate_dockerfile() -> str:
+    """Generate docker/Dockerfile"""
+    return _DOCKERFILE
+
+
+_DOCKER_ENTRYPOINT: Final[str] = '''#!/bin/bash
 # Docker Entrypoint Script
 
 set -e
@@ -314,9 +341,12 @@ exec "$@"
 '''
 
 
-def generate_celery_entrypoint() -> str:
-    """Generate docker/celery-worker-entrypoint.sh"""
-    return '''#!/bin/bash
+def generate_docker_entrypoint() -> str:
+    """Generate docker/docker-entrypoint.sh"""
+    return _DOCKER_ENTRYPOINT
+
+
+_CELERY_ENTRYPOINT: Final[str] = '''#!/bin/bash
 # Celery Worker Entrypoint
 
 set -e
@@ -340,9 +370,12 @@ exec "$@"
 '''
 
 
-def generate_flower_entrypoint() -> str:
-    """Generate docker/flower-entrypoint.sh"""
-    return '''#!/bin/bash
+def generate_celery_entrypoint() -> str:
+    """Generate docker/celery-worker-entrypoint.sh"""
+    return _CELERY_ENTRYPOINT
+
+
+_FLOWER_ENTRYPOINT: Final[str] = '''#!/bin/bash
 # Flower Monitoring Entrypoint
 
 set -e
@@ -364,3 +397,8 @@ echo "🌸 Starting Flower..."
 
 exec "$@"
 '''
+
+
+def generate_flower_entrypoint() -> str:
+    """Generate docker/flower-entrypoint.sh"""
+    return _FLOWER_ENTRYPOINT
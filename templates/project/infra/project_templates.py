@@ -9,6 +9,8 @@ Generates project configuration files:
 - fcube.py script
 """
 
+from typing import Final
+
 
 def generate_pyproject_toml(project_name: str, with_celery: bool = True) -> str:
     """Generate pyproject.toml"""
@@ -34,8 +36,7 @@ dependencies = [
     "python-multipart>=0.0.20",
     "sqlalchemy>=2.0.0",
     "uvicorn[standard]>=0.30.0",
-    "python-jose[cryptography]>=3.3.0",
-    "passlib[bcrypt]>=1.7.4",
+    "pyjwt[crypto]>=2.8.0",
     "bcrypt>=4.0.1,<5.0.0",{celery_deps}
     "typer>=0.12.0",
     "rich>=13.0.0",
@@ -43,26 +44,11 @@ dependencies = [
 '''
 
 
-def generate_env_example(project_name: str, with_celery: bool = True) -> str:
-    """Generate .env.example"""
-    celery_env = ""
-    if with_celery:
-        celery_env = '''
-# ==================== Celery Configuration ====================
-CELERY_BROKER_URL=
-CELERY_RESULT_BACKEND=
-
-# ==================== Flower Configuration ====================
-FLOWER_PORT=5555
-FLOWER_USERNAME=admin
-FLOWER_PASSWORD=change_me_flower_password
-'''
-
-    return f'''# ==================== Environment Configuration ====================
+_ENV_EXAMPLE_BASE: Final[str] = '''# ==================== Environment Configuration ====================
 # Copy this file to .env and update with your actual values
 
 # ==================== Application Settings ====================
-APP_NAME={project_name.replace("_", " ").title()}
+APP_NAME={app_name}
 APP_VERSION=0.1.0
 ENVIRONMENT=development
 DEBUG=true
@@ -79,6 +65,16 @@ POSTGRES_DB={project_name}_db
 POSTGRES_HOST=postgres  # Use 'postgres' for Docker, 'localhost' for local
 POSTGRES_PORT=5432
 
+# Local Docker PostgreSQL tuning (development only)
+# "off" skips WAL syncs, so a crash can corrupt the local database.
+# Never disable these on a database whose data you need to keep; remove
+# these lines (or set them to "on") for any other environment.
+POSTGRES_FSYNC=off
+POSTGRES_SYNCHRONOUS_COMMIT=off
+POSTGRES_FULL_PAGE_WRITES=off
+POSTGRES_SHARED_BUFFERS=256MB
+POSTGRES_WORK_MEM=16MB
+
 # Database Pool Settings
 DB_POOL_SIZE=5
 DB_MAX_OVERFLOW=10
@@ -101,12 +97,32 @@ REDIS_HOST=redis  # Use 'redis' for Docker, 'localhost' for local
 REDIS_PORT=6379
 REDIS_DB=0
 REDIS_PASSWORD=
-{celery_env}'''
+'''
 
+_ENV_EXAMPLE_CELERY: Final[str] = '''
+# ==================== Celery Configuration ====================
+CELERY_BROKER_URL=
+CELERY_RESULT_BACKEND=
 
-def generate_gitignore() -> str:
-    """Generate .gitignore"""
-    return '''# Python
+# ==================== Flower Configuration ====================
+FLOWER_PORT=5555
+FLOWER_USERNAME=admin
+FLOWER_PASSWORD=change_me_flower_password
+'''
+
+
+def generate_env_example(project_name: str, with_celery: bool = True) -> str:
+    """Generate .env.example"""
+    parts = [_ENV_EXAMPLE_BASE]
+    if with_celery:
+        parts.append(_ENV_EXAMPLE_CELERY)
+    return "".join(parts).format(
+        project_name=project_name,
+        app_name=project_name.replace("_", " ").title(),
+    )
+
+
+_GITIGNORE: Final[str] = '''# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -179,6 +195,11 @@ migrations/versions/*.pyc
 '''
 
 
+def generate_gitignore() -> str:
+    """Generate .gitignore"""
+    return _GITIGNORE
+
+
 def generate_project_readme(
     project_name: str,
     project_pascal: str,
@@ -340,9 +361,7 @@ Generated by [FCube CLI](https://github.com/your-repo/fcube)
 '''
 
 
-def generate_fcube_script() -> str:
-    """Generate fcube.py script for the new project."""
-    return '''#!/usr/bin/env python
+_FCUBE_SCRIPT: Final[str] = '''#!/usr/bin/env python
 """
 FCube CLI - Module Generator
 
@@ -366,3 +385,8 @@ except ImportError:
     print("FCube CLI not found. Please install it or copy the fcube/ directory.")
     print("For module generation, use the FCube CLI from your main project.")
 '''
+
+
+def generate_fcube_script() -> str:
+    """Generate fcube.py script for the new project."""
+    return _FCUBE_SCRIPT
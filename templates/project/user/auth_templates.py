@@ -8,10 +8,10 @@ Generates auth_management submodule templates:
 - utils.py
 """
 
+from typing import Final
 
-def generate_user_auth_init() -> str:
-    """Generate user/auth_management/__init__.py."""
-    return '''"""
+
+_USER_AUTH_INIT: Final[str] = '''"""
 Authentication management submodule.
 
 Provides authentication functionality:
@@ -27,6 +27,8 @@ from .utils import (
     create_access_token,
     create_refresh_token,
     get_current_user,
+    UserLoader,
+    get_user_loader,
 )
 
 __all__ = [
@@ -36,13 +38,18 @@ __all__ = [
     "create_access_token",
     "create_refresh_token",
     "get_current_user",
+    "UserLoader",
+    "get_user_loader",
 ]
 '''
 
 
-def generate_user_auth_routes() -> str:
-    """Generate user/auth_management/routes.py."""
-    return '''"""
+def generate_user_auth_init() -> str:
+    """Generate user/auth_management/__init__.py."""
+    return _USER_AUTH_INIT
+
+
+_USER_AUTH_ROUTES: Final[str] = '''"""
 Authentication routes.
 """
 
@@ -120,12 +127,16 @@ async def get_me(
 '''
 
 
-def generate_user_auth_service() -> str:
-    """Generate user/auth_management/service.py."""
-    return '''"""
+def generate_user_auth_routes() -> str:
+    """Generate user/auth_management/routes.py."""
+    return _USER_AUTH_ROUTES
+
+
+_USER_AUTH_SERVICE: Final[str] = '''"""
 Authentication service.
 """
 
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
@@ -158,21 +169,18 @@ class AuthService:
         user_data: UserCreate
     ) -> User:
         """Register a new user."""
-        # Check if user exists
-        existing = await user_crud.get_by_email(session, user_data.email)
-        if existing:
-            raise UserAlreadyExistsError(user_data.email)
-        
-        # Hash password and create user
-        hashed_password = get_password_hash(user_data.password)
+        # Hash password (bcrypt runs off the event loop), then insert; the
+        # insert reports an existing account instead of a separate lookup.
+        hashed_password = await run_in_threadpool(get_password_hash, user_data.password)
         user = await user_crud.create_with_password(
             session,
             obj_in=user_data,
             hashed_password=hashed_password
         )
+        if user is None:
+            raise UserAlreadyExistsError(user_data.email)
         
         await session.commit()
-        await session.refresh(user)
         
         logger.info(f"User registered: {user.email}")
         return user
@@ -188,8 +196,10 @@ class AuthService:
         if not user:
             raise InvalidCredentialsError()
         
-        # Verify password
-        if not verify_password(credentials.password, user.hashed_password):
+        # Verify password (bcrypt runs off the event loop)
+        if not await run_in_threadpool(
+            verify_password, credentials.password, user.hashed_password
+        ):
             raise InvalidCredentialsError()
         
         # Check if active
@@ -238,22 +248,28 @@ class AuthService:
 '''
 
 
-def generate_user_auth_utils() -> str:
-    """Generate user/auth_management/utils.py."""
-    return '''"""
+def generate_user_auth_service() -> str:
+    """Generate user/auth_management/service.py."""
+    return _USER_AUTH_SERVICE
+
+
+_USER_AUTH_UTILS: Final[str] = '''"""
 Authentication utilities.
 
 Provides password hashing, token generation, and user retrieval.
 """
 
+import asyncio
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Union
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.settings import settings
@@ -262,7 +278,23 @@ from ..models import User
 from ..crud import user_crud
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+_BCRYPT_ROUNDS = settings.BCRYPT_ROUNDS
+
+# JWT settings, read once at import
+_JWT_SECRET = settings.JWT_SECRET_KEY
+_JWT_ALGORITHM = settings.JWT_ALGORITHM
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+_ACCESS_TOKEN_TTL = timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+_REFRESH_TOKEN_TTL = timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
+
+# Verified token payloads, keyed by the raw token. FastAPI already shares
+# get_current_user within one request; this avoids re-verifying a token the
+# client sends again on later requests. Entries never outlive the token.
+# Callers always get their own copy, so mutating a payload can't leak into
+# other requests.
+_TOKEN_CACHE_MAX_SIZE = 4096
+_TOKEN_CACHE_TTL_SECONDS = 60.0
+_token_cache: dict[str, tuple[dict, float]] = {}
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
@@ -270,62 +302,84 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(_BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("ascii")
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def verify_password(plain_password: str, hashed_password: Optional[str]) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    if not hashed_password:
+        return False
+    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("ascii"))
 
 
 def create_access_token(subject: str) -> str:
     """Create an access token."""
-    expire = datetime.now(timezone.utc) + timedelta(
-        minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
-    )
+    expire = datetime.now(timezone.utc) + _ACCESS_TOKEN_TTL
     to_encode = {
         "sub": subject,
         "exp": expire,
         "type": "access"
     }
-    return jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    return jwt.encode(to_encode, _JWT_SECRET, algorithm=_JWT_ALGORITHM)
 
 
 def create_refresh_token(subject: str) -> str:
     """Create a refresh token."""
-    expire = datetime.now(timezone.utc) + timedelta(
-        days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS
-    )
+    expire = datetime.now(timezone.utc) + _REFRESH_TOKEN_TTL
     to_encode = {
         "sub": subject,
         "exp": expire,
         "type": "refresh"
     }
-    return jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    return jwt.encode(to_encode, _JWT_SECRET, algorithm=_JWT_ALGORITHM)
 
 
 def decode_token(token: str) -> dict:
     """Decode and validate a JWT token."""
+    now = time.monotonic()
+    cached = _token_cache.get(token)
+    if cached is not None:
+        payload, expires_at = cached
+        if now < expires_at:
+            return dict(payload)
+        _token_cache.pop(token, None)
+
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
-        return payload
-    except JWTError:
+        payload = jwt.decode(token, _JWT_SECRET, algorithms=_JWT_ALGORITHMS)
+    except jwt.PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate token",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    ttl = _TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = min(ttl, exp - time.time())
+    if ttl > 0:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+            # Drop the oldest entry; dicts keep insertion order.
+            _token_cache.pop(next(iter(_token_cache)), None)
+        _token_cache[token] = (dict(payload), now + ttl)
+    return payload
+
 
 async def get_current_user(
+    request: Request,
     token: str = Depends(oauth2_scheme),
     session: AsyncSession = Depends(get_session),
 ) -> User:
-    """Get current authenticated user from token."""
+    """Get current authenticated user from token.
+
+    The user is kept on request.state, so dependencies wired outside
+    FastAPI's per-request cache don't load it again.
+    """
+    user = getattr(request.state, "current_user", None)
+    if user is not None:
+        return user
+
     payload = decode_token(token)
     
     if payload.get("type") != "access":
@@ -354,6 +408,7 @@ async def get_current_user(
             detail="User account is inactive",
         )
     
+    request.state.current_user = user
     return user
 
 
@@ -371,4 +426,75 @@ async def get_current_active_superuser(
             detail="Not enough permissions",
         )
     return current_user
+
+
+class UserLoader:
+    """Coalesce user lookups made while handling one request.
+
+    load() calls issued in the same event-loop tick are answered by a single
+    SELECT ... WHERE id IN (...), and results are remembered, so resolving
+    the users behind a list of rows costs one query instead of one per row.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        self._users: Dict[UUID, Optional[User]] = {}
+        self._pending: Dict[UUID, asyncio.Future] = {}
+        # Holds a reference so the in-flight batch task isn't collected.
+        self._dispatching: Optional[asyncio.Task] = None
+        # AsyncSession must not run two statements at once.
+        self._lock = asyncio.Lock()
+
+    async def load(self, user_id: Union[str, UUID]) -> Optional[User]:
+        if not isinstance(user_id, UUID):
+            user_id = UUID(user_id)
+        if user_id in self._users:
+            return self._users[user_id]
+        future = self._pending.get(user_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._schedule_dispatch)
+            future = self._pending[user_id] = loop.create_future()
+        return await future
+
+    async def load_many(self, user_ids: Iterable[Union[str, UUID]]) -> List[Optional[User]]:
+        return list(await asyncio.gather(*(self.load(user_id) for user_id in user_ids)))
+
+    def _schedule_dispatch(self) -> None:
+        self._dispatching = asyncio.ensure_future(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        async with self._lock:
+            try:
+                result = await self._session.scalars(
+                    select(User).where(User.id.in_(list(pending)))
+                )
+                found = {user.id: user for user in result}
+            except Exception as exc:
+                for future in pending.values():
+                    if not future.done():
+                        future.set_exception(exc)
+                return
+        for user_id, future in pending.items():
+            user = self._users[user_id] = found.get(user_id)
+            if not future.done():
+                future.set_result(user)
+
+
+def get_user_loader(
+    request: Request,
+    session: AsyncSession = Depends(get_session),
+) -> UserLoader:
+    """Get the UserLoader for the current request."""
+    loader = getattr(request.state, "user_loader", None)
+    if loader is None:
+        loader = request.state.user_loader = UserLoader(session)
+    return loader
 '''
+
+
+def generate_user_auth_utils() -> str:
+    """Generate user/auth_management/utils.py."""
+    return _USER_AUTH_UTILS
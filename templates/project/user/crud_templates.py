@@ -2,44 +2,211 @@
 User CRUD Templates.
 
 Generates CRUD operations for User model.
+Lookup methods are emitted per authentication strategy, since the
+email-only and phone-only models lack the other identifier column.
 """
 
+from typing import Final
 
-def generate_user_crud() -> str:
-    """Generate user/crud.py with user CRUD operations."""
-    return '''"""
+from .model_templates import AuthType
+
+
+_USER_CRUD_HEADER: Final[str] = '''"""
 User CRUD operations.
 """
 
-from typing import Optional
+from dataclasses import dataclass, fields
+from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam, select
+{dialect_import}from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from app.core.crud import CRUDBase
-from .models import User
-from .schemas import UserUpdate
+from .models import Role, User, UserStatus
+{schema_import}
+
+# Lookup statements are built once; values are bound per call.
+_GET_WITH_ROLES = (
+    select(User)
+    .where(User.id == bindparam("id"))
+    .options(
+        joinedload(User.roles).selectinload(Role.permissions),
+        # Anything not loaded above fails loudly instead of lazy-loading.
+        raiseload("*"),
+    )
+)
+'''
+
+_GET_BY_EMAIL_STMT: Final[str] = '''_GET_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+'''
 
+_GET_BY_PHONE_STMT: Final[str] = '''_GET_BY_PHONE = select(User).where(User.phone_number == bindparam("phone_number"))
+'''
+
+_USER_SUMMARY_HEAD: Final[str] = '''
+
+@dataclass(slots=True, frozen=True)
+class UserSummary:
+    """Read-only user row for listings, built without ORM hydration."""
+
+    id: UUID
+'''
+
+_USER_SUMMARY_EMAIL: Final[str] = '''    email: str
+'''
+
+_USER_SUMMARY_PHONE: Final[str] = '''    phone_number: str
+'''
+
+_USER_SUMMARY_EMAIL_AND_PHONE: Final[str] = '''    email: Optional[str]
+    phone_number: Optional[str]
+'''
+
+_USER_SUMMARY_TAIL: Final[str] = '''    full_name: Optional[str]
+    status: UserStatus
+    is_active: bool
+
+
+# Selects exactly the UserSummary columns, in field order.
+_LIST_SUMMARIES = (
+    select(*(getattr(User, f.name) for f in fields(UserSummary)))
+    .order_by(User.id)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+'''
+
+_USER_CRUD_CLASS: Final[str] = '''
 
 class UserCRUD(CRUDBase[User, UserUpdate, UserUpdate]):
     """CRUD operations for User model."""
-    
+
     def __init__(self):
         super().__init__(User)
-    
+
+    async def get_with_roles(self, session: AsyncSession, id: UUID) -> Optional[User]:
+        """
+        Get user by ID with roles and their permissions eagerly loaded.
+
+        Roles are joined into the user query (one round trip, plus one for
+        permissions). RBAC relationships are lazy="raise", so use this
+        instead of get() when the caller needs to read roles.
+        """
+        result = await session.execute(_GET_WITH_ROLES, {"id": id})
+        # Joined collection loads repeat the user row once per role.
+        return result.unique().scalar_one_or_none()
+
+    async def list_summaries(
+        self, session: AsyncSession, *, skip: int = 0, limit: int = 100
+    ) -> List[UserSummary]:
+        """List users as UserSummary rows instead of full User objects."""
+        result = await session.execute(_LIST_SUMMARIES, {"skip": skip, "limit": limit})
+        return [UserSummary(*row) for row in result]
+'''
+
+_CREATE_WITH_PASSWORD_HEAD: Final[str] = '''
+    async def create_with_password(
+        self,
+        session: AsyncSession,
+        *,
+        obj_in: UserCreate,
+        hashed_password: str,
+    ) -> Optional[User]:
+        """
+        Create a user with an already-hashed password.
+        Note: Does NOT commit. Call session.commit() from service layer.
+
+        Issued as INSERT ... ON CONFLICT DO NOTHING RETURNING, so the
+        uniqueness check and the insert are one race-free round trip.
+
+        Returns:
+            The new user, or None if the email (or phone) is already taken
+        """
+        stmt = (
+            pg_insert(User)
+            .values(
+                email=obj_in.email,
+'''
+
+_CREATE_WITH_PASSWORD_PHONE: Final[str] = '''                phone_number=obj_in.phone_number,
+'''
+
+_CREATE_WITH_PASSWORD_TAIL: Final[str] = '''                full_name=obj_in.full_name,
+                hashed_password=hashed_password,
+            )
+            .on_conflict_do_nothing()
+            .returning(User)
+        )
+        return await session.scalar(stmt)
+'''
+
+_GET_BY_EMAIL_METHOD: Final[str] = '''
     async def get_by_email(self, session: AsyncSession, email: str) -> Optional[User]:
         """Get user by email."""
-        query = select(self.model).where(self.model.email == email)
-        result = await session.execute(query)
-        return result.scalar_one_or_none()
-    
+        return await session.scalar(_GET_BY_EMAIL, {"email": email})
+'''
+
+_GET_BY_PHONE_METHOD: Final[str] = '''
     async def get_by_phone(self, session: AsyncSession, phone_number: str) -> Optional[User]:
         """Get user by phone number."""
-        query = select(self.model).where(self.model.phone_number == phone_number)
-        result = await session.execute(query)
-        return result.scalar_one_or_none()
+        return await session.scalar(_GET_BY_PHONE, {"phone_number": phone_number})
+'''
 
+_USER_CRUD_FOOTER: Final[str] = '''
 
 user_crud = UserCRUD()
 '''
+
+
+def generate_user_crud(auth_type: AuthType = AuthType.EMAIL) -> str:
+    """Generate user/crud.py with user CRUD operations.
+
+    Args:
+        auth_type: The authentication type - email, phone, or both.
+    """
+    with_email = auth_type in (AuthType.EMAIL, AuthType.BOTH)
+    with_phone = auth_type in (AuthType.PHONE, AuthType.BOTH)
+
+    schema_import = (
+        "from .schemas import UserCreate, UserUpdate"
+        if with_email
+        else "from .schemas import UserUpdate"
+    )
+
+    dialect_import = (
+        "from sqlalchemy.dialects.postgresql import insert as pg_insert\n"
+        if with_email
+        else ""
+    )
+
+    parts = [
+        _USER_CRUD_HEADER.format(
+            schema_import=schema_import,
+            dialect_import=dialect_import,
+        )
+    ]
+    if with_email:
+        parts.append(_GET_BY_EMAIL_STMT)
+    if with_phone:
+        parts.append(_GET_BY_PHONE_STMT)
+    parts.append(_USER_SUMMARY_HEAD)
+    if with_email and with_phone:
+        parts.append(_USER_SUMMARY_EMAIL_AND_PHONE)
+    elif with_email:
+        parts.append(_USER_SUMMARY_EMAIL)
+    else:
+        parts.append(_USER_SUMMARY_PHONE)
+    parts.append(_USER_SUMMARY_TAIL)
+    parts.append(_USER_CRUD_CLASS)
+    if with_email:
+        parts.append(_GET_BY_EMAIL_METHOD)
+        parts.append(_CREATE_WITH_PASSWORD_HEAD)
+        if with_phone:
+            parts.append(_CREATE_WITH_PASSWORD_PHONE)
+        parts.append(_CREATE_WITH_PASSWORD_TAIL)
+    if with_phone:
+        parts.append(_GET_BY_PHONE_METHOD)
+    parts.append(_USER_CRUD_FOOTER)
+    return "".join(parts)
@@ -4,10 +4,10 @@ User Exception Templates.
 Generates custom HTTP exceptions for User module.
 """
 
+from typing import Final
 
-def generate_user_exceptions() -> str:
-    """Generate user/exceptions.py with user-related exceptions."""
-    return '''"""
+
+_USER_EXCEPTIONS: Final[str] = '''"""
 User module exceptions.
 """
 
@@ -95,3 +95,8 @@ class OTPMaxAttemptsError(HTTPException):
             detail="Maximum OTP attempts exceeded"
         )
 '''
+
+
+def generate_user_exceptions() -> str:
+    """Generate user/exceptions.py with user-related exceptions."""
+    return _USER_EXCEPTIONS
@@ -9,6 +9,8 @@ Supports different authentication strategies:
 """
 
 from enum import Enum
+from functools import lru_cache
+from typing import Final
 
 
 class AuthType(str, Enum):
@@ -18,9 +20,7 @@ class AuthType(str, Enum):
     BOTH = "both"
 
 
-def generate_user_init() -> str:
-    """Generate user/__init__.py"""
-    return '''"""
+_USER_INIT: Final[str] = '''"""
 User module for authentication and user management.
 
 This module provides:
@@ -39,44 +39,89 @@ __all__ = [
 '''
 
 
-def generate_user_models(auth_type: AuthType = AuthType.EMAIL) -> str:
-    """Generate user/models.py with User and RBAC models.
-    
-    Args:
-        auth_type: The authentication type - email, phone, or both.
-    """
-    if auth_type == AuthType.EMAIL:
-        return _generate_user_models_email()
-    elif auth_type == AuthType.PHONE:
-        return _generate_user_models_phone()
-    else:
-        return _generate_user_models_both()
-
-
-def _generate_user_models_email() -> str:
-    """Generate user models with email authentication."""
-    return '''"""
-User database models.
+def generate_user_init() -> str:
+    """Generate user/__init__.py"""
+    return _USER_INIT
+
+
+# Module docstring and imports; filled in per auth strategy.
+_USER_MODELS_HEADER: Final[str] = '''"""
+{title}
 """
 
-from datetime import datetime, timezone
-from uuid import uuid4, UUID as UUIDType
+import os
+import time
+from datetime import {datetime_names}
+from functools import lru_cache
+from uuid import UUID as UUIDType
 from typing import Optional, List
 from enum import Enum
 
-from sqlalchemy import String, DateTime, Boolean, Text, Enum as SQLEnum, ForeignKey, Index
+from sqlalchemy import {sqlalchemy_names}
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.models import Base
 
 
-def utc_now():
-    """Reusable function for UTC timestamp defaults."""
-    return datetime.now(timezone.utc)
+'''
 
 
-class UserType(str, Enum):
+# Column factories shared by every model in the generated module.
+_COLUMN_FACTORIES: Final[str] = '''def uuid7() -> UUIDType:
+    """Time-ordered UUID (RFC 9562 version 7).
+
+    Keys from the same period sort together, so primary key index inserts
+    land on the right-hand B-tree pages instead of random ones.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 9562 variant
+    return UUIDType(int=value)
+
+
+def pk_uuid():
+    """UUID primary key; the server default covers rows inserted outside the ORM."""
+    return mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid7,
+        server_default=text("gen_random_uuid()")
+    )
+
+
+def fk_uuid(target: str, **kwargs):
+    """UUID foreign key that is deleted along with its target row."""
+    return mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey(target, ondelete="CASCADE"),
+        **kwargs
+    )
+
+
+def ts_col():
+    """Timestamp set by the database on insert."""
+    return mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+
+def ts_updated_col():
+    """Timestamp set by the database on insert and every update."""
+    return mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+
+
+'''
+
+
+_USER_ENUMS: Final[str] = '''class UserType(str, Enum):
     """Enum for different user types.
     
     Add project-specific user types below ADMIN_STAFF.
@@ -96,19 +141,32 @@ class UserStatus(str, Enum):
     PENDING_VERIFICATION = "pending_verification"
 
 
-class User(Base):
+@lru_cache(maxsize=None)
+def _enum_values(enum_cls: type[Enum]) -> list[str]:
+    """Store enum values rather than member names; built once per enum."""
+    return [e.value for e in enum_cls]
+
+
+# Column types for the enums above. The names are explicit so that the
+# PostgreSQL enum types stay stable for Alembic across class renames.
+USER_TYPE_ENUM = SQLEnum(UserType, values_callable=_enum_values, name="usertype")
+USER_STATUS_ENUM = SQLEnum(UserStatus, values_callable=_enum_values, name="userstatus")
+
+
+'''
+
+
+_USER_CLASS_EMAIL: Final[str] = '''class User(Base):
     """User model with email/password authentication."""
     
     __tablename__ = "users"
     __table_args__ = (
         Index('ix_users_type_status', 'user_type', 'status'),
     )
+    # Fetch server-side timestamps via RETURNING instead of expiring them.
+    __mapper_args__ = {"eager_defaults": True}
     
-    id: Mapped[UUIDType] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid4
-    )
+    id: Mapped[UUIDType] = pk_uuid()
     
     # Email authentication
     email: Mapped[str] = mapped_column(
@@ -133,12 +191,12 @@ class User(Base):
         nullable=True
     )
     user_type: Mapped[UserType] = mapped_column(
-        SQLEnum(UserType, values_callable=lambda x: [e.value for e in x]),
+        USER_TYPE_ENUM,
         nullable=False,
         default=UserType.ADMIN_STAFF
     )
     status: Mapped[UserStatus] = mapped_column(
-        SQLEnum(UserStatus, values_callable=lambda x: [e.value for e in x]),
+        USER_STATUS_ENUM,
         default=UserStatus.ACTIVE,
         nullable=False
     )
@@ -156,212 +214,40 @@ class User(Base):
     )
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=utc_now,
-        nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=utc_now,
-        onupdate=utc_now,
-        nullable=False
-    )
+    created_at: Mapped[datetime] = ts_col()
+    updated_at: Mapped[datetime] = ts_updated_col()
     
     # Relationships
+    # User is loaded on every authenticated request: declare any relationship
+    # added here with lazy="raise" and load it explicitly where it is needed.
+    # Not loaded implicitly; use user_crud.get_with_roles() when needed.
     roles: Mapped[List["Role"]] = relationship(
         "Role",
         secondary="user_roles",
         back_populates="users",
-        lazy="selectin"
+        lazy="raise"
     )
     
     def __repr__(self) -> str:
-        return f"<User(id={self.id}, email={self.email})>"
-
+        # Loaded state only: repr must never trigger a lazy load.
+        state = self.__dict__
+        return f"<User(id={state.get('id')}, email={state.get('email')})>"
 
-class Permission(Base):
-    """Permission model for RBAC."""
 
-    __tablename__ = "permissions"
-    __table_args__ = (
-        Index('ix_permissions_resource_action', 'resource', 'action'),
-    )
-
-    id: Mapped[UUIDType] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid4
-    )
-
-    name: Mapped[str] = mapped_column(
-        String(100),
-        unique=True,
-        nullable=False
-    )
-
-    resource: Mapped[str] = mapped_column(String(50), nullable=False)
-    action: Mapped[str] = mapped_column(String(50), nullable=False)
-    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=utc_now,
-        nullable=False
-    )
-
-    roles: Mapped[List["Role"]] = relationship(
-        "Role",
-        secondary="role_permissions",
-        back_populates="permissions",
-        lazy="noload"
-    )
-
-
-class Role(Base):
-    """Role model for RBAC."""
-
-    __tablename__ = "roles"
-
-    id: Mapped[UUIDType] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid4
-    )
-
-    name: Mapped[str] = mapped_column(
-        String(50),
-        unique=True,
-        nullable=False
-    )
-    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    is_system: Mapped[bool] = mapped_column(
-        Boolean,
-        default=False,
-        nullable=False
-    )
-
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=utc_now,
-        nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=utc_now,
-        onupdate=utc_now,
-        nullable=False
-    )
-
-    permissions: Mapped[List["Permission"]] = relationship(
-        "Permission",
-        secondary="role_permissions",
-        back_populates="roles",
-        lazy="selectin"
-    )
-    users: Mapped[List["User"]] = relationship(
-        "User",
-        secondary="user_roles",
-        back_populates="roles",
-        lazy="noload"
-    )
-
-
-class RolePermission(Base):
-    """Association table for Role-Permission."""
-
-    __tablename__ = "role_permissions"
-
-    role_id: Mapped[UUIDType] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("roles.id", ondelete="CASCADE"),
-        primary_key=True
-    )
-    permission_id: Mapped[UUIDType] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("permissions.id", ondelete="CASCADE"),
-        primary_key=True
-    )
-    granted_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=utc_now,
-        nullable=False
-    )
-
-
-class UserRole(Base):
-    """Association table for User-Role."""
-
-    __tablename__ = "user_roles"
-
-    user_id: Mapped[UUIDType] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("users.id", ondelete="CASCADE"),
-        primary_key=True
-    )
-    role_id: Mapped[UUIDType] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("roles.id", ondelete="CASCADE"),
-        primary_key=True
-    )
-    assigned_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=utc_now,
-        nullable=False
-    )
 '''
 
 
-def _generate_user_models_phone() -> str:
-    """Generate user models with phone OTP authentication."""
-    return '''"""
-User database models with Phone OTP authentication.
-"""
-
-from datetime import datetime, timezone
-from uuid import uuid4, UUID as UUIDType
-from typing import Optional, List
-from enum import Enum
-
-from sqlalchemy import String, DateTime, Boolean, Text, Enum as SQLEnum, ForeignKey, Index, Integer
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-
-from app.core.models import Base
-
-
-def utc_now():
-    """Reusable function for UTC timestamp defaults."""
-    return datetime.now(timezone.utc)
-
-
-class UserType(str, Enum):
-    """Enum for different user types."""
-    ADMIN_STAFF = "admin_staff"
-    # Add your project-specific user types here
-
-
-class UserStatus(str, Enum):
-    """Enum for user account status."""
-    ACTIVE = "active"
-    INACTIVE = "inactive"
-    SUSPENDED = "suspended"
-    PENDING_VERIFICATION = "pending_verification"
-
-
-class User(Base):
+_USER_CLASS_PHONE: Final[str] = '''class User(Base):
     """User model with phone OTP authentication."""
     
     __tablename__ = "users"
     __table_args__ = (
         Index('ix_users_type_status', 'user_type', 'status'),
     )
+    # Fetch server-side timestamps via RETURNING instead of expiring them.
+    __mapper_args__ = {"eager_defaults": True}
     
-    id: Mapped[UUIDType] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid4
-    )
+    id: Mapped[UUIDType] = pk_uuid()
     
     # Phone authentication
     phone_number: Mapped[str] = mapped_column(
@@ -382,12 +268,12 @@ class User(Base):
         nullable=True
     )
     user_type: Mapped[UserType] = mapped_column(
-        SQLEnum(UserType, values_callable=lambda x: [e.value for e in x]),
+        USER_TYPE_ENUM,
         nullable=False,
         default=UserType.ADMIN_STAFF
     )
     status: Mapped[UserStatus] = mapped_column(
-        SQLEnum(UserStatus, values_callable=lambda x: [e.value for e in x]),
+        USER_STATUS_ENUM,
         default=UserStatus.PENDING_VERIFICATION,
         nullable=False
     )
@@ -405,24 +291,18 @@ class User(Base):
     )
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=utc_now,
-        nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=utc_now,
-        onupdate=utc_now,
-        nullable=False
-    )
+    created_at: Mapped[datetime] = ts_col()
+    updated_at: Mapped[datetime] = ts_updated_col()
     
     # Relationships
+    # User is loaded on every authenticated request: declare any relationship
+    # added here with lazy="raise" and load it explicitly where it is needed.
+    # Not loaded implicitly; use user_crud.get_with_roles() when needed.
     roles: Mapped[List["Role"]] = relationship(
         "Role",
         secondary="user_roles",
         back_populates="users",
-        lazy="selectin"
+        lazy="raise"
     )
     otp_codes: Mapped[List["OTPCode"]] = relationship(
         "OTPCode",
@@ -431,25 +311,85 @@ class User(Base):
     )
     
     def __repr__(self) -> str:
-        return f"<User(id={self.id}, phone={self.phone_number})>"
+        # Loaded state only: repr must never trigger a lazy load.
+        state = self.__dict__
+        return f"<User(id={state.get('id')}, phone={state.get('phone_number')})>"
 
 
-class OTPCode(Base):
-    """OTP code for phone verification."""
-    
-    __tablename__ = "otp_codes"
+'''
+
+
+_USER_CLASS_BOTH: Final[str] = '''class User(Base):
+    """User model with both email and phone authentication."""
     
-    id: Mapped[UUIDType] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid4
+    __tablename__ = "users"
+    __table_args__ = (
+        Index('ix_users_type_status', 'user_type', 'status'),
     )
-    user_id: Mapped[UUIDType] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("users.id", ondelete="CASCADE"),
+    # Fetch server-side timestamps via RETURNING instead of expiring them.
+    __mapper_args__ = {"eager_defaults": True}
+    
+    id: Mapped[UUIDType] = pk_uuid()
+    
+    # Email authentication (optional)
+    email: Mapped[Optional[str]] = mapped_column(String(255), unique=True, index=True, nullable=True)
+    hashed_password: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    email_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    
+    # Phone authentication (optional)
+    phone_number: Mapped[Optional[str]] = mapped_column(String(20), unique=True, index=True, nullable=True)
+    phone_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    
+    # Basic details
+    full_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    user_type: Mapped[UserType] = mapped_column(
+        USER_TYPE_ENUM,
         nullable=False,
-        index=True
+        default=UserType.ADMIN_STAFF
+    )
+    status: Mapped[UserStatus] = mapped_column(
+        USER_STATUS_ENUM,
+        default=UserStatus.ACTIVE,
+        nullable=False
     )
+    
+    # Status flags
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    is_superuser: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    
+    # Timestamps
+    created_at: Mapped[datetime] = ts_col()
+    updated_at: Mapped[datetime] = ts_updated_col()
+    
+    # Relationships
+    # User is loaded on every authenticated request: declare any relationship
+    # added here with lazy="raise" and load it explicitly where it is needed.
+    # Not loaded implicitly; use user_crud.get_with_roles() when needed.
+    roles: Mapped[List["Role"]] = relationship("Role", secondary="user_roles", back_populates="users", lazy="raise")
+    otp_codes: Mapped[List["OTPCode"]] = relationship("OTPCode", back_populates="user", lazy="noload")
+    
+    def __repr__(self) -> str:
+        # Loaded state only: repr must never trigger a lazy load.
+        state = self.__dict__
+        identifier = state.get("email") or state.get("phone_number")
+        return f"<User(id={state.get('id')}, identifier={identifier})>"
+
+
+'''
+
+# Shared by the phone and both variants.
+_OTP_CODE_MODEL: Final[str] = '''class OTPCode(Base):
+    """OTP code for phone verification."""
+    
+    __tablename__ = "otp_codes"
+    __table_args__ = (
+        # Serves both the user_id foreign key and active-code lookups.
+        Index('ix_otp_codes_user_valid', 'user_id', 'is_used', 'expires_at'),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+    
+    id: Mapped[UUIDType] = pk_uuid()
+    user_id: Mapped[UUIDType] = fk_uuid("users.id", nullable=False)
     code: Mapped[str] = mapped_column(
         String(6),
         nullable=False
@@ -478,11 +418,7 @@ class OTPCode(Base):
         DateTime(timezone=True),
         nullable=False
     )
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=utc_now,
-        nullable=False
-    )
+    created_at: Mapped[datetime] = ts_col()
     
     # Relationships
     user: Mapped["User"] = relationship(
@@ -492,203 +428,176 @@ class OTPCode(Base):
     
     @property
     def is_expired(self) -> bool:
-        return datetime.now(timezone.utc) > self.expires_at
+        return self.is_expired_at(datetime.now(timezone.utc))
     
     @property
     def is_valid(self) -> bool:
-        return not self.is_used and not self.is_expired and self.attempts < self.max_attempts
+        return (
+            not self.is_used
+            and self.attempts < self.max_attempts
+            and not self.is_expired
+        )
+    
+    def is_expired_at(self, now: datetime) -> bool:
+        """Pass `now` when checking several codes to read the clock once."""
+        return now > self.expires_at
+    
+    def is_valid_at(self, now: datetime) -> bool:
+        return (
+            not self.is_used
+            and self.attempts < self.max_attempts
+            and not self.is_expired_at(now)
+        )
+
+
+'''
 
 
-class Permission(Base):
-    """Permission model for RBAC."""
+# RBAC models are identical across all auth strategies.
+_RBAC_MODELS: Final[str] = '''class Permission(Base):
+    """Permission model for RBAC.
+
+    Relationships are lazy="raise"; load them explicitly with
+    selectinload() where they are needed.
+    """
+
     __tablename__ = "permissions"
     __table_args__ = (
         Index('ix_permissions_resource_action', 'resource', 'action'),
     )
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[UUIDType] = pk_uuid()
+
+    name: Mapped[str] = mapped_column(
+        String(100),
+        unique=True,
+        nullable=False
+    )
 
-    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     resource: Mapped[str] = mapped_column(String(50), nullable=False)
     action: Mapped[str] = mapped_column(String(50), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
-    roles: Mapped[List["Role"]] = relationship("Role", secondary="role_permissions", back_populates="permissions", lazy="noload")
+
+    created_at: Mapped[datetime] = ts_col()
+
+    roles: Mapped[List["Role"]] = relationship(
+        "Role",
+        secondary="role_permissions",
+        back_populates="permissions",
+        lazy="raise"
+    )
 
 
 class Role(Base):
     """Role model for RBAC."""
+
     __tablename__ = "roles"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    id: Mapped[UUIDType] = pk_uuid()
+
+    name: Mapped[str] = mapped_column(
+        String(50),
+        unique=True,
+        nullable=False
+    )
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    is_system: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False)
-    permissions: Mapped[List["Permission"]] = relationship("Permission", secondary="role_permissions", back_populates="roles", lazy="selectin")
-    users: Mapped[List["User"]] = relationship("User", secondary="user_roles", back_populates="roles", lazy="noload")
+    is_system: Mapped[bool] = mapped_column(
+        Boolean,
+        default=False,
+        nullable=False
+    )
+
+    created_at: Mapped[datetime] = ts_col()
+    updated_at: Mapped[datetime] = ts_updated_col()
+
+    permissions: Mapped[List["Permission"]] = relationship(
+        "Permission",
+        secondary="role_permissions",
+        back_populates="roles",
+        lazy="raise"
+    )
+    users: Mapped[List["User"]] = relationship(
+        "User",
+        secondary="user_roles",
+        back_populates="roles",
+        lazy="raise"
+    )
 
 
 class RolePermission(Base):
     """Association table for Role-Permission."""
+
     __tablename__ = "role_permissions"
-    role_id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True)
-    permission_id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), ForeignKey("permissions.id", ondelete="CASCADE"), primary_key=True)
-    granted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
+    __mapper_args__ = {"eager_defaults": True}
+
+    role_id: Mapped[UUIDType] = fk_uuid("roles.id", primary_key=True)
+    permission_id: Mapped[UUIDType] = fk_uuid("permissions.id", primary_key=True)
+    granted_at: Mapped[datetime] = ts_col()
 
 
 class UserRole(Base):
     """Association table for User-Role."""
-    __tablename__ = "user_roles"
-    user_id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
-    role_id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True)
-    assigned_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
-'''
-
-
-def _generate_user_models_both() -> str:
-    """Generate user models with both email and phone authentication."""
-    return '''"""
-User database models with Email + Phone OTP authentication.
-"""
-
-from datetime import datetime, timezone
-from uuid import uuid4, UUID as UUIDType
-from typing import Optional, List
-from enum import Enum
-
-from sqlalchemy import String, DateTime, Boolean, Text, Enum as SQLEnum, ForeignKey, Index, Integer
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-
-from app.core.models import Base
-
-
-def utc_now():
-    return datetime.now(timezone.utc)
-
-
-class UserType(str, Enum):
-    """Enum for different user types."""
-    ADMIN_STAFF = "admin_staff"
-
-
-class UserStatus(str, Enum):
-    """Enum for user account status."""
-    ACTIVE = "active"
-    INACTIVE = "inactive"
-    SUSPENDED = "suspended"
-    PENDING_VERIFICATION = "pending_verification"
 
+    __tablename__ = "user_roles"
+    __mapper_args__ = {"eager_defaults": True}
 
-class User(Base):
-    """User model with both email and phone authentication."""
-    
-    __tablename__ = "users"
-    __table_args__ = (
-        Index('ix_users_type_status', 'user_type', 'status'),
-    )
-    
-    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    
-    # Email authentication (optional)
-    email: Mapped[Optional[str]] = mapped_column(String(255), unique=True, index=True, nullable=True)
-    hashed_password: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    email_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    
-    # Phone authentication (optional)
-    phone_number: Mapped[Optional[str]] = mapped_column(String(20), unique=True, index=True, nullable=True)
-    phone_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    
-    # Basic details
-    full_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    user_type: Mapped[UserType] = mapped_column(
-        SQLEnum(UserType, values_callable=lambda x: [e.value for e in x]),
-        nullable=False,
-        default=UserType.ADMIN_STAFF
-    )
-    status: Mapped[UserStatus] = mapped_column(
-        SQLEnum(UserStatus, values_callable=lambda x: [e.value for e in x]),
-        default=UserStatus.ACTIVE,
-        nullable=False
-    )
-    
-    # Status flags
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    is_superuser: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False)
-    
-    # Relationships
-    roles: Mapped[List["Role"]] = relationship("Role", secondary="user_roles", back_populates="users", lazy="selectin")
-    otp_codes: Mapped[List["OTPCode"]] = relationship("OTPCode", back_populates="user", lazy="noload")
-    
-    def __repr__(self) -> str:
-        identifier = self.email or self.phone_number
-        return f"<User(id={self.id}, identifier={identifier})>"
+    user_id: Mapped[UUIDType] = fk_uuid("users.id", primary_key=True)
+    role_id: Mapped[UUIDType] = fk_uuid("roles.id", primary_key=True)
+    assigned_at: Mapped[datetime] = ts_col()
+'''
 
 
-class OTPCode(Base):
-    """OTP code for phone verification."""
-    __tablename__ = "otp_codes"
-    
-    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    code: Mapped[str] = mapped_column(String(6), nullable=False)
-    purpose: Mapped[str] = mapped_column(String(50), nullable=False, default="login")
-    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    max_attempts: Mapped[int] = mapped_column(Integer, default=3, nullable=False)
-    is_used: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
-    
-    user: Mapped["User"] = relationship("User", back_populates="otp_codes")
-    
-    @property
-    def is_expired(self) -> bool:
-        return datetime.now(timezone.utc) > self.expires_at
+_BASE_SQLALCHEMY_NAMES: Final[str] = "String, DateTime, Boolean, Text, Enum as SQLEnum, ForeignKey, Index, func"
+
+# Fragments per auth strategy; joined on first use by generate_user_models.
+_USER_MODELS_PARTS: Final[dict[AuthType, tuple[str, ...]]] = {
+    AuthType.EMAIL: (
+        _USER_MODELS_HEADER.format(
+            title="User database models.",
+            datetime_names="datetime",
+            sqlalchemy_names=f"{_BASE_SQLALCHEMY_NAMES}, text",
+        ),
+        _COLUMN_FACTORIES,
+        _USER_ENUMS,
+        _USER_CLASS_EMAIL,
+        _RBAC_MODELS,
+    ),
+    AuthType.PHONE: (
+        _USER_MODELS_HEADER.format(
+            title="User database models with Phone OTP authentication.",
+            datetime_names="datetime, timezone",
+            sqlalchemy_names=f"{_BASE_SQLALCHEMY_NAMES}, Integer, text",
+        ),
+        _COLUMN_FACTORIES,
+        _USER_ENUMS,
+        _USER_CLASS_PHONE,
+        _OTP_CODE_MODEL,
+        _RBAC_MODELS,
+    ),
+    AuthType.BOTH: (
+        _USER_MODELS_HEADER.format(
+            title="User database models with Email + Phone OTP authentication.",
+            datetime_names="datetime, timezone",
+            sqlalchemy_names=f"{_BASE_SQLALCHEMY_NAMES}, Integer, text",
+        ),
+        _COLUMN_FACTORIES,
+        _USER_ENUMS,
+        _USER_CLASS_BOTH,
+        _OTP_CODE_MODEL,
+        _RBAC_MODELS,
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def generate_user_models(auth_type: AuthType = AuthType.EMAIL) -> str:
+    """Generate user/models.py with User and RBAC models.
     
-    @property
-    def is_valid(self) -> bool:
-        return not self.is_used and not self.is_expired and self.attempts < self.max_attempts
-
-
-class Permission(Base):
-    __tablename__ = "permissions"
-    __table_args__ = (Index('ix_permissions_resource_action', 'resource', 'action'),)
-    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
-    resource: Mapped[str] = mapped_column(String(50), nullable=False)
-    action: Mapped[str] = mapped_column(String(50), nullable=False)
-    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
-    roles: Mapped[List["Role"]] = relationship("Role", secondary="role_permissions", back_populates="permissions", lazy="noload")
-
-
-class Role(Base):
-    __tablename__ = "roles"
-    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
-    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    is_system: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False)
-    permissions: Mapped[List["Permission"]] = relationship("Permission", secondary="role_permissions", back_populates="roles", lazy="selectin")
-    users: Mapped[List["User"]] = relationship("User", secondary="user_roles", back_populates="roles", lazy="noload")
-
-
-class RolePermission(Base):
-    __tablename__ = "role_permissions"
-    role_id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True)
-    permission_id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), ForeignKey("permissions.id", ondelete="CASCADE"), primary_key=True)
-    granted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
-
+    Args:
+        auth_type: The authentication type - email, phone, or both.
 
-class UserRole(Base):
-    __tablename__ = "user_roles"
-    user_id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
-    role_id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True)
-    assigned_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
-'''
+    Only the requested variant is assembled, once per process.
+    """
+    return "".join(_USER_MODELS_PARTS[auth_type])
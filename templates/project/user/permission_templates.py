@@ -7,10 +7,10 @@ Generates permission_management submodule templates:
 - scoped_access.py (Scoped access framework)
 """
 
+from typing import Final
 
-def generate_user_permission_init() -> str:
-    """Generate user/permission_management/__init__.py."""
-    return '''"""
+
+_USER_PERMISSION_INIT: Final[str] = '''"""
 Permission Management Module
 
 Provides RBAC functionality and Scoped Access Control.
@@ -55,19 +55,23 @@ __all__ = [
 '''
 
 
-def generate_user_permission_utils() -> str:
-    """Generate user/permission_management/utils.py with PermissionChecker."""
-    return '''"""
+def generate_user_permission_init() -> str:
+    """Generate user/permission_management/__init__.py."""
+    return _USER_PERMISSION_INIT
+
+
+_USER_PERMISSION_UTILS: Final[str] = '''"""
 Permission Management Utilities
 
 Comprehensive RBAC utilities and PermissionChecker.
 """
 
-from typing import List, Set, Optional, Union
+import sys
+from typing import List, Set, Optional, Tuple, Union
 from uuid import UUID
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, exists as sql_exists
+from sqlalchemy import bindparam, select, exists as sql_exists
 from app.core.database import get_session
 from app.core.logging import get_logger
 from app.user.auth_management.utils import get_current_user_validated
@@ -77,10 +81,39 @@ logger = get_logger(__name__)
 
 SUPER_ADMIN_ROLE = "super_admin"
 
+# Built once at import; each call only binds the user id.
+_SUPER_ADMIN_Q = select(
+    sql_exists()
+    .where(UserRole.user_id == bindparam("uid"))
+    .where(Role.name == SUPER_ADMIN_ROLE)
+    .where(UserRole.role_id == Role.id)
+    .correlate(UserRole, Role)
+)
+
+# Duplicates collapse in the caller's set, so no DISTINCT sort on the server.
+_USER_PERMS_Q = (
+    select(Permission.name)
+    .join(RolePermission, RolePermission.permission_id == Permission.id)
+    .join(UserRole, UserRole.role_id == RolePermission.role_id)
+    .where(UserRole.user_id == bindparam("uid"))
+    .execution_options(yield_per=200)
+)
+
+_USER_ACCESS_Q = (
+    select(Role.name.label("role"), Permission.name.label("perm"))
+    .select_from(UserRole)
+    .join(Role, Role.id == UserRole.role_id)
+    .outerjoin(RolePermission, RolePermission.role_id == Role.id)
+    .outerjoin(Permission, Permission.id == RolePermission.permission_id)
+    .where(UserRole.user_id == bindparam("uid"))
+)
+
 
 class BasePermissionChecker:
     """Base permission checker for super admin + basic RBAC authorization."""
 
+    __slots__ = ("required_permissions", "require_all", "_required_set", "_check")
+
     def __init__(
         self,
         required_permissions: Optional[Union[str, List[str]]] = None,
@@ -89,30 +122,27 @@ class BasePermissionChecker:
         if required_permissions:
             if isinstance(required_permissions, str):
                 required_permissions = [required_permissions]
-            self.required_permissions = required_permissions
+            # Interned so set lookups against loaded names can match by identity.
+            self.required_permissions = [sys.intern(p) for p in required_permissions]
         else:
             self.required_permissions = []
+        self._required_set = frozenset(self.required_permissions)
         self.require_all = require_all
+        self._check = self._check_all if require_all else self._check_any
 
     async def __call__(
         self,
+        request: Request,
         current_user: UserModel = Depends(get_current_user_validated),
         session: AsyncSession = Depends(get_session)
     ) -> UserModel:
-        if await self.is_super_admin(session, current_user.id):
+        is_super, user_permissions = await self.get_user_access(
+            request, session, current_user.id)
+        if is_super:
             return current_user
 
-        if self.required_permissions:
-            user_permissions = await self.get_user_permissions(session, current_user.id)
-            has_access = False
-            if self.require_all:
-                has_access = all(
-                    perm in user_permissions for perm in self.required_permissions)
-            else:
-                has_access = any(
-                    perm in user_permissions for perm in self.required_permissions)
-            if has_access:
-                return current_user
+        if self.required_permissions and self._check(user_permissions):
+            return current_user
 
         self.handle_authorization_failure(current_user)
         raise HTTPException(
@@ -120,6 +150,12 @@ class BasePermissionChecker:
             detail="Access denied"
         )
 
+    def _check_all(self, user_permissions: Set[str]) -> bool:
+        return self._required_set.issubset(user_permissions)
+
+    def _check_any(self, user_permissions: Set[str]) -> bool:
+        return not self._required_set.isdisjoint(user_permissions)
+
     def handle_authorization_failure(self, current_user: UserModel) -> None:
         logger.warning(
             f"Permission denied for user {current_user.id}. Required: {self.required_permissions}")
@@ -128,33 +164,50 @@ class BasePermissionChecker:
             detail=f"Missing required permission(s): {', '.join(self.required_permissions)}"
         )
 
+    @classmethod
+    async def get_user_access(
+        cls,
+        request: Request,
+        session: AsyncSession,
+        user_id: Union[str, UUID]
+    ) -> Tuple[bool, Set[str]]:
+        """Return (is_super_admin, permissions), loaded at most once per request."""
+        cache = request.state.__dict__.setdefault("_perm_cache", {})
+        access = cache.get(user_id)
+        if access is None:
+            access = cache[user_id] = await cls.load_user_access(session, user_id)
+        return access
+
+    @staticmethod
+    async def load_user_access(
+        session: AsyncSession,
+        user_id: Union[str, UUID]
+    ) -> Tuple[bool, Set[str]]:
+        """Fetch super-admin status and permission names in one query."""
+        result = await session.execute(_USER_ACCESS_Q, {"uid": user_id})
+        is_super = False
+        permissions: Set[str] = set()
+        for row in result:
+            if row.role == SUPER_ADMIN_ROLE:
+                is_super = True
+            if row.perm:
+                permissions.add(sys.intern(row.perm))
+        return is_super, permissions
+
     @staticmethod
     async def is_super_admin(session: AsyncSession, user_id: Union[str, UUID]) -> bool:
-        query = select(
-            sql_exists()
-            .where(UserRole.user_id == user_id)
-            .where(Role.name == SUPER_ADMIN_ROLE)
-            .where(UserRole.role_id == Role.id)
-            .correlate(UserRole, Role)
-        )
-        result = await session.execute(query)
-        return result.scalar()
+        return bool(await session.scalar(_SUPER_ADMIN_Q, {"uid": user_id}))
 
     @staticmethod
     async def get_user_permissions(session: AsyncSession, user_id: Union[str, UUID]) -> Set[str]:
-        query = (
-            select(Permission.name.distinct())
-            .join(RolePermission, RolePermission.permission_id == Permission.id)
-            .join(UserRole, UserRole.role_id == RolePermission.role_id)
-            .where(UserRole.user_id == user_id)
-        )
-        result = await session.execute(query)
-        return set(result.scalars().all())
+        result = await session.stream(_USER_PERMS_Q, {"uid": user_id})
+        return {sys.intern(row[0]) async for row in result}
 
 
 class PermissionChecker(BasePermissionChecker):
     """Standard permission checker for pure RBAC authorization."""
-    pass
+
+    __slots__ = ()
 
 
 def require_permission(permission: str) -> PermissionChecker:
@@ -169,11 +222,30 @@ def require_all_permissions(*permissions: str) -> PermissionChecker:
     return PermissionChecker(list(permissions), require_all=True)
 
 
-async def has_permission(user: UserModel, permission: str, session: AsyncSession) -> bool:
-    if await BasePermissionChecker.is_super_admin(session, user.id):
+async def has_permission(
+    user: UserModel,
+    permission: str,
+    session: AsyncSession,
+    *,
+    super_admin: Optional[bool] = None,
+    request: Optional[Request] = None
+) -> bool:
+    """Check a single permission for a user.
+
+    Pass ``super_admin`` when the caller already knows the user's super-admin
+    status, or ``request`` to reuse the access already loaded by a checker.
+    """
+    if super_admin:
         return True
-    user_permissions = await BasePermissionChecker.get_user_permissions(session, user.id)
-    return permission in user_permissions
+    if request is not None:
+        is_super, user_permissions = await BasePermissionChecker.get_user_access(
+            request, session, user.id)
+    elif super_admin is None:
+        is_super, user_permissions = await BasePermissionChecker.load_user_access(session, user.id)
+    else:
+        is_super = False
+        user_permissions = await BasePermissionChecker.get_user_permissions(session, user.id)
+    return is_super or permission in user_permissions
 
 
 async def is_super_admin(user: UserModel, session: AsyncSession) -> bool:
@@ -181,19 +253,22 @@ async def is_super_admin(user: UserModel, session: AsyncSession) -> bool:
 '''
 
 
-def generate_user_permission_scoped_access() -> str:
-    """Generate user/permission_management/scoped_access.py."""
-    return '''"""
+def generate_user_permission_utils() -> str:
+    """Generate user/permission_management/utils.py with PermissionChecker."""
+    return _USER_PERMISSION_UTILS
+
+
+_USER_PERMISSION_SCOPED_ACCESS: Final[str] = '''"""
 Generic Scoped Access Framework.
 
 Provides plugin-based scope infrastructure for data access control.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Tuple, Union
 from uuid import UUID
 from pydantic import BaseModel
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
 from sqlalchemy.orm import InstrumentedAttribute
@@ -266,10 +341,22 @@ class ScopeRegistry:
     """Registry for scope providers."""
 
     _providers: Dict[str, ScopeProvider] = {}
+    # Derived from _providers on register(); the first provider claiming a
+    # permission wins, as with a scan in registration order.
+    _permission_to_provider: Dict[str, ScopeProvider] = {}
+    _all_scoped_perms: Tuple[str, ...] = ()
 
     @classmethod
     def register(cls, provider: ScopeProvider) -> None:
         cls._providers[provider.scope_name] = provider
+        index: Dict[str, ScopeProvider] = {}
+        all_perms: List[str] = []
+        for registered in cls._providers.values():
+            for perm in registered.permissions:
+                index.setdefault(perm, registered)
+                all_perms.append(perm)
+        cls._permission_to_provider = index
+        cls._all_scoped_perms = tuple(all_perms)
 
     @classmethod
     def get(cls, scope_name: str) -> Optional[ScopeProvider]:
@@ -277,21 +364,17 @@ class ScopeRegistry:
 
     @classmethod
     def get_by_permission(cls, permission: str) -> Optional[ScopeProvider]:
-        for provider in cls._providers.values():
-            if permission in provider.permissions:
-                return provider
-        return None
+        return cls._permission_to_provider.get(permission)
 
     @classmethod
     def all_scoped_permissions(cls) -> List[str]:
-        perms = []
-        for provider in cls._providers.values():
-            perms.extend(provider.permissions)
-        return perms
+        return list(cls._all_scoped_perms)
 
     @classmethod
     def clear(cls) -> None:
         cls._providers = {}
+        cls._permission_to_provider = {}
+        cls._all_scoped_perms = ()
 
 
 # ============== Scoped Permission Checker ==============
@@ -299,6 +382,8 @@ class ScopeRegistry:
 class ScopedPermissionChecker(BasePermissionChecker):
     """Permission checker that resolves admin scope."""
 
+    __slots__ = ("global_permissions", "scoped_permissions")
+
     def __init__(
         self,
         global_permissions: List[str],
@@ -311,14 +396,15 @@ class ScopedPermissionChecker(BasePermissionChecker):
 
     async def __call__(
         self,
+        request: Request,
         current_user: User = Depends(get_current_user_validated),
         session: AsyncSession = Depends(get_session)
     ) -> tuple[User, AdminScope]:
-        if await self.is_super_admin(session, current_user.id):
+        is_super, user_perms = await self.get_user_access(
+            request, session, current_user.id)
+        if is_super:
             return current_user, AdminScope(scope_type="global")
 
-        user_perms = await self.get_user_permissions(session, current_user.id)
-
         if any(p in user_perms for p in self.global_permissions):
             return current_user, AdminScope(scope_type="global")
 
@@ -339,3 +425,8 @@ def require_scoped_permission(
 ) -> ScopedPermissionChecker:
     return ScopedPermissionChecker(global_permissions, scoped_permissions)
 '''
+
+
+def generate_user_permission_scoped_access() -> str:
+    """Generate user/permission_management/scoped_access.py."""
+    return _USER_PERMISSION_SCOPED_ACCESS
@@ -4,10 +4,10 @@ User Route Templates.
 Generates base route aggregator for User module.
 """
 
+from typing import Final
 
-def generate_user_routes() -> str:
-    """Generate user/routes.py."""
-    return '''"""
+
+_USER_ROUTES: Final[str] = '''"""
 User module routes aggregator.
 """
 
@@ -20,3 +20,8 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 # Include authentication routes
 router.include_router(auth_router)
 '''
+
+
+def generate_user_routes() -> str:
+    """Generate user/routes.py."""
+    return _USER_ROUTES
@@ -8,17 +8,72 @@ Supports different authentication strategies:
 - both: Combined email and phone authentication
 """
 
+from functools import lru_cache
+from typing import Final
+
 from .model_templates import AuthType
 
 
-def generate_user_schemas(auth_type: AuthType = AuthType.EMAIL) -> str:
-    """Generate user/schemas.py with Pydantic schemas.
-    
-    Args:
-        auth_type: The authentication type - email, phone, or both.
-    """
-    # Build auth-specific schemas
-    email_schemas = '''
+_USER_SCHEMAS_DOC: Final[str] = '''"""
+User Pydantic schemas.
+"""
+
+'''
+
+_USER_SCHEMAS_IMPORTS: Final[str] = '''from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, TypeAdapter
+'''
+
+_USER_SCHEMAS_IMPORTS_EMAIL: Final[str] = '''import re
+from datetime import datetime
+from typing import Annotated, List, Optional
+from uuid import UUID
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+)
+
+
+# Login only needs a plausible address to look up; full validation runs
+# through EmailStr when the account is created.
+EMAIL_RE = re.compile(r"^[^@\\s]+@[^@\\s]+\\.[^@\\s]+$")
+
+
+def _lower_domain(email: str) -> str:
+    # EmailStr stores the domain lowercased; match that for lookups.
+    local, _, domain = email.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+LoginEmail = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, pattern=EMAIL_RE.pattern),
+    AfterValidator(_lower_domain),
+]
+'''
+
+_USER_SCHEMAS_HEAD: Final[str] = '''
+
+# ==================== BASE SCHEMAS ====================
+
+class UserBase(BaseModel):
+    """Base user schema."""
+    email: Optional[EmailStr] = None
+    phone_number: Optional[str] = None
+    full_name: Optional[str] = None
+
+'''
+
+_EMAIL_SCHEMAS: Final[str] = '''
 class UserCreate(UserBase):
     """Schema for creating a user with email/password."""
     password: str = Field(..., min_length=8)
@@ -26,11 +81,11 @@ class UserCreate(UserBase):
 
 class UserLogin(BaseModel):
     """Login request schema."""
-    email: EmailStr
+    email: LoginEmail
     password: str
-''' if auth_type in [AuthType.EMAIL, AuthType.BOTH] else ''
+'''
 
-    phone_schemas = '''
+_PHONE_SCHEMAS: Final[str] = '''
 class PhoneLoginRequest(BaseModel):
     """Request OTP for phone login."""
     phone_number: str = Field(..., pattern=r"^\\+?[1-9]\\d{1,14}$")
@@ -40,29 +95,9 @@ class OTPVerifyRequest(BaseModel):
     """Verify OTP code."""
     phone_number: str
     otp_code: str = Field(..., min_length=4, max_length=6)
-''' if auth_type in [AuthType.PHONE, AuthType.BOTH] else ''
-
-    return f'''"""
-User Pydantic schemas.
-"""
-
-from datetime import datetime
-from typing import Optional
-from uuid import UUID
-
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
-
-
-# ==================== BASE SCHEMAS ====================
-
-class UserBase(BaseModel):
-    """Base user schema."""
-    email: Optional[EmailStr] = None
-    phone_number: Optional[str] = None
-    full_name: Optional[str] = None
+'''
 
-{email_schemas}
-{phone_schemas}
+_USER_SCHEMAS_TAIL: Final[str] = '''
 
 # ==================== UPDATE SCHEMAS ====================
 
@@ -78,7 +113,7 @@ class UserUpdate(BaseModel):
 
 class UserResponse(BaseModel):
     """User response schema."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     
     id: UUID
     email: Optional[str] = None
@@ -92,7 +127,7 @@ class UserResponse(BaseModel):
 
 class UserMinimal(BaseModel):
     """Minimal user schema for nested responses."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     
     id: UUID
     email: Optional[str] = None
@@ -100,6 +135,11 @@ class UserMinimal(BaseModel):
     full_name: Optional[str] = None
 
 
+# Validates a whole list of ORM rows in one pydantic-core call:
+#   UserResponseList.validate_python(users, from_attributes=True)
+UserResponseList = TypeAdapter(List[UserResponse])
+
+
 # ==================== TOKEN SCHEMAS ====================
 
 class TokenResponse(BaseModel):
@@ -120,3 +160,25 @@ class TokenPayload(BaseModel):
     exp: datetime
     type: str  # "access" or "refresh"
 '''
+
+
+@lru_cache(maxsize=None)
+def generate_user_schemas(auth_type: AuthType = AuthType.EMAIL) -> str:
+    """Generate user/schemas.py with Pydantic schemas.
+    
+    Args:
+        auth_type: The authentication type - email, phone, or both.
+    """
+    with_email = auth_type in (AuthType.EMAIL, AuthType.BOTH)
+    with_phone = auth_type in (AuthType.PHONE, AuthType.BOTH)
+
+    parts = [_USER_SCHEMAS_DOC]
+    parts.append(_USER_SCHEMAS_IMPORTS_EMAIL if with_email else _USER_SCHEMAS_IMPORTS)
+    parts.append(_USER_SCHEMAS_HEAD)
+    if with_email:
+        parts.append(_EMAIL_SCHEMAS)
+    parts.append("\n")
+    if with_phone:
+        parts.append(_PHONE_SCHEMAS)
+    parts.append(_USER_SCHEMAS_TAIL)
+    return "".join(parts)
@@ -6,33 +6,11 @@ Generates FastAPI routes with proper organization:
 - Admin routes (permission-based access)
 """
 
+from functools import lru_cache
+from typing import Final
 
-def generate_routes_init(
-    module_name: str,
-    class_name: str,
-    with_public: bool = True,
-    with_admin: bool = True
-) -> str:
-    """
-    Generate routes/__init__.py file.
-    
-    Follows the pattern from app/service_provider/routes/__init__.py
-    """
-    imports = []
-    includes = []
-    
-    if with_public:
-        imports.append(f"from .public import public_router")
-        includes.append(f'{module_name}_router.include_router(public_router, prefix="", tags=["{class_name}s - Public"])')
-    
-    if with_admin:
-        imports.append(f"from .admin import admin_router")
-        includes.append(f'{module_name}_router.include_router(admin_router, prefix="/admin", tags=["{class_name}s - Admin"])')
-    
-    imports_str = "\n".join(imports) if imports else "# No sub-routers"
-    includes_str = "\n".join(includes) if includes else "# No sub-routers included"
-    
-    return f'''"""
+
+_ROUTES_INIT_HEAD: Final[str] = '''"""
 {class_name} Routes Package.
 
 This module aggregates all routers for the {module_name} module.
@@ -44,8 +22,9 @@ Route Organization:
 
 from fastapi import APIRouter
 
-{imports_str}
+'''
 
+_ROUTES_INIT_ROUTER: Final[str] = '''
 # Main module router
 {module_name}_router = APIRouter(
     prefix="/{module_name}s",
@@ -53,17 +32,56 @@ from fastapi import APIRouter
 )
 
 # Include sub-routers
-{includes_str}
+'''
 
+_ROUTES_INIT_TAIL: Final[str] = '''
 __all__ = ["{module_name}_router"]
 '''
 
+_PUBLIC_ROUTER_IMPORT: Final[str] = "from .public import public_router\n"
+_ADMIN_ROUTER_IMPORT: Final[str] = "from .admin import admin_router\n"
+_NO_ROUTER_IMPORTS: Final[str] = "# No sub-routers\n"
 
-def generate_public_routes_init(module_name: str, class_name: str) -> str:
+_PUBLIC_ROUTER_INCLUDE: Final[str] = (
+    '{module_name}_router.include_router(public_router, prefix="", tags=["{class_name}s - Public"])\n'
+)
+_ADMIN_ROUTER_INCLUDE: Final[str] = (
+    '{module_name}_router.include_router(admin_router, prefix="/admin", tags=["{class_name}s - Admin"])\n'
+)
+_NO_ROUTER_INCLUDES: Final[str] = "# No sub-routers included\n"
+
+
+@lru_cache(maxsize=256)
+def generate_routes_init(
+    module_name: str,
+    class_name: str,
+    with_public: bool = True,
+    with_admin: bool = True
+) -> str:
     """
-    Generate routes/public/__init__.py file.
+    Generate routes/__init__.py file.
+    
+    Follows the pattern from app/service_provider/routes/__init__.py
     """
-    return f'''"""
+    parts = [_ROUTES_INIT_HEAD]
+    if with_public:
+        parts.append(_PUBLIC_ROUTER_IMPORT)
+    if with_admin:
+        parts.append(_ADMIN_ROUTER_IMPORT)
+    if not (with_public or with_admin):
+        parts.append(_NO_ROUTER_IMPORTS)
+    parts.append(_ROUTES_INIT_ROUTER)
+    if with_public:
+        parts.append(_PUBLIC_ROUTER_INCLUDE)
+    if with_admin:
+        parts.append(_ADMIN_ROUTER_INCLUDE)
+    if not (with_public or with_admin):
+        parts.append(_NO_ROUTER_INCLUDES)
+    parts.append(_ROUTES_INIT_TAIL)
+    return "".join(parts).format(module_name=module_name, class_name=class_name)
+
+
+_PUBLIC_ROUTES_INIT: Final[str] = '''"""
 Public {class_name} Routes.
 
 These routes are publicly accessible (no authentication required).
@@ -84,13 +102,15 @@ __all__ = ["public_router"]
 '''
 
 
-def generate_public_routes(module_name: str, class_name: str) -> str:
+@lru_cache(maxsize=256)
+def generate_public_routes_init(module_name: str, class_name: str) -> str:
     """
-    Generate public route file.
-    
-    Follows the pattern for public read-only endpoints.
+    Generate routes/public/__init__.py file.
     """
-    return f'''"""
+    return _PUBLIC_ROUTES_INIT.format(module_name=module_name, class_name=class_name)
+
+
+_PUBLIC_ROUTES_HEAD: Final[str] = '''"""
 Public {class_name} Routes.
 
 These endpoints are publicly accessible without authentication.
@@ -112,9 +132,12 @@ from ...services import {class_name}Service
 logger = get_logger(__name__)
 
 router = APIRouter()
+'''
 
+# Endpoint definitions, shared with the single-file routes module.
+_PUBLIC_ROUTES_ENDPOINTS: Final[str] = '''
 
-@router.get(
+@{router}.get(
     "/",
     response_model={class_name}ListResponse,
     summary="List all {module_name}s",
@@ -132,13 +155,12 @@ async def list_{module_name}s(
     - **skip**: Number of records to skip (default: 0)
     - **limit**: Maximum number of records to return (default: 20, max: 100)
     """
-    items = await service.get_all_{module_name}s(
+    items, total = await service.list_{module_name}s_with_total(
         session,
         skip=skip,
         limit=limit,
         active_only=True
     )
-    total = await service.get_{module_name}_count(session)
     
     return {class_name}ListResponse(
         items=items,
@@ -148,7 +170,7 @@ async def list_{module_name}s(
     )
 
 
-@router.get(
+@{router}.get(
     "/{{{module_name}_id}}",
     response_model={class_name},
     summary="Get {module_name} by ID",
@@ -168,11 +190,21 @@ async def get_{module_name}(
 '''
 
 
-def generate_admin_routes_init(module_name: str, class_name: str) -> str:
+@lru_cache(maxsize=256)
+def generate_public_routes(module_name: str, class_name: str) -> str:
     """
-    Generate routes/admin/__init__.py file.
+    Generate public route file.
+    
+    Follows the pattern for public read-only endpoints.
     """
-    return f'''"""
+    return (_PUBLIC_ROUTES_HEAD + _PUBLIC_ROUTES_ENDPOINTS).format(
+        module_name=module_name,
+        class_name=class_name,
+        router="router",
+    )
+
+
+_ADMIN_ROUTES_INIT: Final[str] = '''"""
 Admin {class_name} Routes.
 
 These routes require admin permissions.
@@ -193,15 +225,15 @@ __all__ = ["admin_router"]
 '''
 
 
-def generate_admin_routes(module_name: str, class_name: str) -> str:
+@lru_cache(maxsize=256)
+def generate_admin_routes_init(module_name: str, class_name: str) -> str:
     """
-    Generate admin management route file.
-    
-    Follows the pattern for admin CRUD endpoints with permissions.
+    Generate routes/admin/__init__.py file.
     """
-    upper_name = module_name.upper()
-    
-    return f'''"""
+    return _ADMIN_ROUTES_INIT.format(module_name=module_name, class_name=class_name)
+
+
+_ADMIN_ROUTES_HEAD: Final[str] = '''"""
 Admin {class_name} Management Routes.
 
 These endpoints require admin permissions for managing {module_name}s.
@@ -212,9 +244,10 @@ from typing import List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, Path, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_session
+from app.core.database import async_session_factory, get_session
 from app.core.logging import get_logger
 from app.user.auth import get_current_user_validated, UserModel
 from ...schemas import (
@@ -234,11 +267,14 @@ from ...permissions import (
 logger = get_logger(__name__)
 
 router = APIRouter()
+'''
 
+# Endpoint definitions, shared with the single-file routes module.
+_ADMIN_ROUTES_ENDPOINTS: Final[str] = '''
 
 # ==================== LIST/READ ====================
 
-@router.get(
+@{router}.get(
     "/",
     response_model={class_name}ListResponse,
     summary="[Admin] List all {module_name}s",
@@ -256,13 +292,12 @@ async def admin_list_{module_name}s(
     """
     Admin: List all {module_name}s with optional inactive records.
     """
-    items = await service.get_all_{module_name}s(
+    items, total = await service.list_{module_name}s_with_total(
         session,
         skip=skip,
         limit=limit,
         active_only=not include_inactive
     )
-    total = await service.get_{module_name}_count(session, active_only=not include_inactive)
     
     return {class_name}ListResponse(
         items=items,
@@ -272,7 +307,34 @@ async def admin_list_{module_name}s(
     )
 
 
-@router.get(
+@{router}.get(
+    "/stream",
+    response_class=StreamingResponse,
+    summary="[Admin] Stream all {module_name}s",
+    description="Stream every {module_name} as newline-delimited JSON without building the full list in memory.",
+    dependencies=[Depends(require_{module_name}_read_permission)],
+)
+async def admin_stream_{module_name}s(
+    include_inactive: bool = Query(False, description="Include inactive records"),
+    service: {class_name}Service = Depends(get_{module_name}_service),
+    current_user: UserModel = Depends(get_current_user_validated),
+):
+    """
+    Admin: Stream {module_name}s as NDJSON, one object per line.
+    """
+    async def generate_lines():
+        # Own session: the body is sent after request dependencies may close.
+        async with async_session_factory() as session:
+            async for item in service.stream_{module_name}s(
+                session,
+                active_only=not include_inactive
+            ):
+                yield {class_name}.model_validate(item).model_dump_json() + "\\n"
+    
+    return StreamingResponse(generate_lines(), media_type="application/x-ndjson")
+
+
+@{router}.get(
     "/{{{module_name}_id}}",
     response_model={class_name},
     summary="[Admin] Get {module_name} details",
@@ -296,7 +358,7 @@ async def admin_get_{module_name}(
 
 # ==================== CREATE ====================
 
-@router.post(
+@{router}.post(
     "/",
     response_model={class_name},
     status_code=status.HTTP_201_CREATED,
@@ -318,7 +380,7 @@ async def admin_create_{module_name}(
 
 # ==================== UPDATE ====================
 
-@router.patch(
+@{router}.patch(
     "/{{{module_name}_id}}",
     response_model={class_name},
     summary="[Admin] Update {module_name}",
@@ -340,7 +402,7 @@ async def admin_update_{module_name}(
 
 # ==================== DELETE ====================
 
-@router.delete(
+@{router}.delete(
     "/{{{module_name}_id}}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="[Admin] Delete {module_name}",
@@ -361,3 +423,134 @@ async def admin_delete_{module_name}(
     logger.info(f"Admin {{current_user.email}} deleting {module_name} {{{module_name}_id}} (hard={{hard_delete}})")
     await service.delete_{module_name}(session, {module_name}_id, soft_delete=not hard_delete)
 '''
+
+
+@lru_cache(maxsize=256)
+def generate_admin_routes(module_name: str, class_name: str) -> str:
+    """
+    Generate admin management route file.
+    
+    Follows the pattern for admin CRUD endpoints with permissions.
+    """
+    return (_ADMIN_ROUTES_HEAD + _ADMIN_ROUTES_ENDPOINTS).format(
+        module_name=module_name,
+        class_name=class_name,
+        router="router",
+    )
+
+
+_ROUTES_SINGLE_FILE_DOC: Final[str] = '''"""
+{class_name} Routes.
+
+All routers for the {module_name} module in a single file.
+
+Route Organization:
+- /                 -> Public routes (read-only, no auth)
+- /admin/           -> Admin routes (requires permissions)
+"""
+
+from typing import List
+from uuid import UUID
+
+'''
+
+_ROUTES_SINGLE_FILE_IMPORTS_PUBLIC: Final[str] = '''from fastapi import APIRouter, Depends, Query, Path, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_session
+from app.core.logging import get_logger
+from .schemas import {class_name}, {class_name}ListResponse
+from .dependencies import get_{module_name}_service
+from .services import {class_name}Service
+'''
+
+_ROUTES_SINGLE_FILE_IMPORTS_ADMIN: Final[str] = '''from fastapi import APIRouter, Depends, Query, Path, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import async_session_factory, get_session
+from app.core.logging import get_logger
+from app.user.auth import get_current_user_validated, UserModel
+from .schemas import (
+    {class_name},
+    {class_name}CreateRequest,
+    {class_name}Update,
+    {class_name}ListResponse,
+)
+from .dependencies import get_{module_name}_service
+from .services import {class_name}Service
+from .permissions import (
+    require_{module_name}_read_permission,
+    require_{module_name}_write_permission,
+    require_{module_name}_delete_permission,
+)
+'''
+
+_ROUTES_SINGLE_FILE_LOGGER: Final[str] = '''
+logger = get_logger(__name__)
+'''
+
+_ROUTES_SINGLE_FILE_PUBLIC: Final[str] = '''
+
+# ==================== PUBLIC ROUTES ====================
+
+public_router = APIRouter()
+'''
+
+_ROUTES_SINGLE_FILE_ADMIN: Final[str] = '''
+
+# ==================== ADMIN ROUTES ====================
+
+admin_router = APIRouter()
+'''
+
+_ROUTES_SINGLE_FILE_MODULE_ROUTER: Final[str] = '''
+
+# ==================== MODULE ROUTER ====================
+
+{module_name}_router = APIRouter(
+    prefix="/{module_name}s",
+    tags=["{class_name}s"]
+)
+
+'''
+
+_ROUTES_SINGLE_FILE_TAIL: Final[str] = '''
+__all__ = ["{module_name}_router"]
+'''
+
+
+@lru_cache(maxsize=256)
+def generate_routes_single_file(
+    module_name: str,
+    class_name: str,
+    with_public: bool = True,
+    with_admin: bool = True
+) -> str:
+    """
+    Generate a single routes.py holding the public and admin routers.
+    
+    Used in place of the routes/ package; the endpoints are the same
+    ones the package layout generates.
+    """
+    parts = [_ROUTES_SINGLE_FILE_DOC]
+    if with_admin:
+        parts.append(_ROUTES_SINGLE_FILE_IMPORTS_ADMIN)
+    else:
+        parts.append(_ROUTES_SINGLE_FILE_IMPORTS_PUBLIC)
+    parts.append(_ROUTES_SINGLE_FILE_LOGGER)
+    if with_public:
+        parts.append(_ROUTES_SINGLE_FILE_PUBLIC)
+        parts.append(_PUBLIC_ROUTES_ENDPOINTS.replace("{router}", "public_router"))
+    if with_admin:
+        parts.append(_ROUTES_SINGLE_FILE_ADMIN)
+        parts.append(_ADMIN_ROUTES_ENDPOINTS.replace("{router}", "admin_router"))
+    parts.append(_ROUTES_SINGLE_FILE_MODULE_ROUTER)
+    if with_public:
+        parts.append(_PUBLIC_ROUTER_INCLUDE)
+    if with_admin:
+        parts.append(_ADMIN_ROUTER_INCLUDE)
+    if not (with_public or with_admin):
+        parts.append(_NO_ROUTER_INCLUDES)
+    parts.append(_ROUTES_SINGLE_FILE_TAIL)
+    return "".join(parts).format(module_name=module_name, class_name=class_name)
@@ -4,14 +4,11 @@ Schema template generators.
 Generates Pydantic schemas following the project patterns.
 """
 
+from functools import lru_cache
+from typing import Final
 
-def generate_schemas(module_name: str, class_name: str) -> str:
-    """
-    Generate Pydantic schemas file.
-    
-    Follows the pattern from app/service_provider/schemas/provider_schemas.py
-    """
-    return f'''"""
+
+_SCHEMAS_BODY: Final[str] = '''"""
 {class_name} Pydantic schemas.
 
 This module contains all Pydantic schemas for the {module_name} entity:
@@ -155,13 +152,17 @@ class {class_name}ListResponse(BaseModel):
 '''
 
 
-def generate_schema_init(module_name: str, class_name: str) -> str:
+@lru_cache(maxsize=256)
+def generate_schemas(module_name: str, class_name: str) -> str:
     """
-    Generate schemas/__init__.py file.
+    Generate Pydantic schemas file.
     
-    Follows the pattern from app/service_provider/schemas/__init__.py
+    Follows the pattern from app/service_provider/schemas/provider_schemas.py
     """
-    return f'''"""
+    return _SCHEMAS_BODY.format(module_name=module_name, class_name=class_name)
+
+
+_SCHEMA_INIT_BODY: Final[str] = '''"""
 {class_name} Schemas Package.
 
 This module exports all Pydantic schemas for the {module_name} module.
@@ -189,3 +190,13 @@ __all__ = [
     "{class_name}ListResponse",
 ]
 '''
+
+
+@lru_cache(maxsize=256)
+def generate_schema_init(module_name: str, class_name: str) -> str:
+    """
+    Generate schemas/__init__.py file.
+    
+    Follows the pattern from app/service_provider/schemas/__init__.py
+    """
+    return _SCHEMA_INIT_BODY.format(module_name=module_name, class_name=class_name)
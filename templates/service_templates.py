@@ -5,15 +5,11 @@ Generates service layer following the business logic patterns.
 Services own transaction boundaries and call commit().
 """
 
+from functools import lru_cache
+from typing import Final
 
-def generate_service(module_name: str, class_name: str) -> str:
-    """
-    Generate service layer file.
-    
-    Follows the pattern from app/service_provider/services/provider_service.py
-    Services own transaction boundaries (commit happens here, not in CRUD).
-    """
-    return f'''"""
+
+_SERVICE_BODY: Final[str] = '''"""
 {class_name} Service - Business Logic Layer.
 
 This service handles all business logic for {module_name} operations.
@@ -31,7 +27,7 @@ Pattern:
 - Use session.refresh() after commit for fresh data
 """
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -80,6 +76,50 @@ class {class_name}Service:
             return await {module_name}_crud.get_active(session, skip, limit)
         return await {module_name}_crud.get_multi(session, skip=skip, limit=limit)
     
+    @staticmethod
+    async def list_{module_name}s_with_total(
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = True
+    ) -> Tuple[List[{class_name}], int]:
+        """
+        Get a page of {module_name}s and the total count in one query.
+        
+        Args:
+            session: Database session
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            active_only: If True, list and count only active records
+            
+        Returns:
+            Tuple of ({class_name} instances, total count)
+        """
+        logger.info(f"Listing {module_name}s (skip={{skip}}, limit={{limit}}, active_only={{active_only}})")
+        return await {module_name}_crud.list_with_total(
+            session,
+            skip=skip,
+            limit=limit,
+            active_only=active_only
+        )
+    
+    @staticmethod
+    def stream_{module_name}s(
+        session: AsyncSession,
+        active_only: bool = True
+    ) -> AsyncIterator[{class_name}]:
+        """
+        Iterate over all {module_name}s in batches.
+        
+        Args:
+            session: Database session, kept open while iterating
+            active_only: If True, yield only active records
+            
+        Returns:
+            Async iterator of {class_name} instances
+        """
+        return {module_name}_crud.stream(session, active_only=active_only)
+    
     @staticmethod
     async def get_{module_name}_by_id(
         session: AsyncSession,
@@ -286,13 +326,18 @@ class {class_name}Service:
 '''
 
 
-def generate_service_init(module_name: str, class_name: str) -> str:
+@lru_cache(maxsize=256)
+def generate_service(module_name: str, class_name: str) -> str:
     """
-    Generate services/__init__.py file.
+    Generate service layer file.
     
-    Follows the pattern from app/service_provider/services/__init__.py
+    Follows the pattern from app/service_provider/services/provider_service.py
+    Services own transaction boundaries (commit happens here, not in CRUD).
     """
-    return f'''"""
+    return _SERVICE_BODY.format(module_name=module_name, class_name=class_name)
+
+
+_SERVICE_INIT_BODY: Final[str] = '''"""
 {class_name} Services Package.
 
 This module exports all services for the {module_name} module.
@@ -306,3 +351,13 @@ __all__ = [
     "{class_name}Service",
 ]
 '''
+
+
+@lru_cache(maxsize=256)
+def generate_service_init(module_name: str, class_name: str) -> str:
+    """
+    Generate services/__init__.py file.
+    
+    Follows the pattern from app/service_provider/services/__init__.py
+    """
+    return _SERVICE_INIT_BODY.format(module_name=module_name, class_name=class_name)
@@ -8,6 +8,7 @@ from .helpers import (
     to_upper_case,
     ensure_directory,
     write_file,
+    write_files,
 )
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
     "to_upper_case",
     "ensure_directory",
     "write_file",
+    "write_files",
 ]
@@ -6,11 +6,27 @@ Provides utilities for:
 - Directory and file operations
 """
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple, Union
 
 
+# Compiled once; the case helpers run many times per scaffolded module.
+_SEPARATORS_TO_UNDERSCORE = str.maketrans('- ', '__')
+_WORD_BOUNDARY_RE = re.compile('(.)([A-Z][a-z]+)')
+_LOWER_UPPER_RE = re.compile('([a-z0-9])([A-Z])')
+_UNDERSCORES_RE = re.compile('_+')
+
+# Flags for write_file; O_BINARY only exists (and matters) on Windows.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+_OVERWRITE_FLAGS = _WRITE_FLAGS | os.O_TRUNC
+_CREATE_ONLY_FLAGS = _WRITE_FLAGS | os.O_EXCL
+
+
+@lru_cache(maxsize=512)
 def to_snake_case(text: str) -> str:
     """
     Convert text to snake_case.
@@ -22,17 +38,18 @@ def to_snake_case(text: str) -> str:
         serviceProvider -> service_provider
     """
     # Replace hyphens and spaces with underscores
-    text = text.replace('-', '_').replace(' ', '_')
+    text = text.translate(_SEPARATORS_TO_UNDERSCORE)
 
     # Insert underscores before uppercase letters
-    text = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
-    text = re.sub('([a-z0-9])([A-Z])', r'\1_\2', text)
+    text = _WORD_BOUNDARY_RE.sub(r'\1_\2', text)
+    text = _LOWER_UPPER_RE.sub(r'\1_\2', text)
 
     # Remove duplicate underscores and lowercase
-    text = re.sub('_+', '_', text)
+    text = _UNDERSCORES_RE.sub('_', text)
     return text.lower().strip('_')
 
 
+@lru_cache(maxsize=512)
 def to_pascal_case(text: str) -> str:
     """
     Convert text to PascalCase.
@@ -46,7 +63,7 @@ def to_pascal_case(text: str) -> str:
     text = text.replace('_', ' ').replace('-', ' ')
 
     # Capitalize each word and join
-    return ''.join(word.capitalize() for word in text.split())
+    return ''.join(map(str.capitalize, text.split()))
 
 
 def to_camel_case(text: str) -> str:
@@ -83,6 +100,7 @@ def to_upper_case(text: str) -> str:
     return to_snake_case(text).upper()
 
 
+@lru_cache(maxsize=512)
 def pluralize(text: str) -> str:
     """
     Simple pluralization for English words.
@@ -105,28 +123,66 @@ def ensure_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def write_file(path: Path, content: str, overwrite: bool = False) -> bool:
+def write_file(path: Path, content: Union[str, bytes], overwrite: bool = False) -> bool:
     """
     Write content to file.
 
     Args:
         path: File path to write to
-        content: Content to write
+        content: Content to write; bytes are written as-is, text as UTF-8
         overwrite: If True, overwrite existing file
 
     Returns:
         True if file was written, False if it exists and overwrite is False
     """
-    if path.exists() and not overwrite:
-        return False
-
     # Ensure parent directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
-    
-    path.write_text(content, encoding='utf-8')
+
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    # O_EXCL makes the existence check and the create a single call.
+    try:
+        fd = os.open(path, _OVERWRITE_FLAGS if overwrite else _CREATE_ONLY_FLAGS, 0o644)
+    except FileExistsError:
+        return False
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
     return True
 
 
+def write_files(
+    files: Iterable[Tuple[Path, Union[str, bytes]]],
+    overwrite: bool = False,
+    max_workers: int = 8,
+) -> List[bool]:
+    """
+    Write several files concurrently.
+
+    File writes release the GIL, so a small thread pool overlaps the
+    open/write/close syscalls of the many small files a scaffold creates.
+
+    Args:
+        files: (path, content) pairs, as accepted by write_file
+        overwrite: If True, overwrite existing files
+        max_workers: Maximum number of writer threads
+
+    Returns:
+        The write_file result for each entry, in input order
+    """
+    files = list(files)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda entry: write_file(entry[0], entry[1], overwrite=overwrite),
+            files,
+        ))
+
+
+@lru_cache(maxsize=512)
 def get_table_name(class_name: str) -> str:
     """
     Convert class name to database table name (plural snake_case).